@@ -31,6 +31,8 @@ from zabob.common.subproc import (
     check_pid,
     exec_cmd,
     CompletedProcess,
+    SpawnerPool,
+    spawner_pool,
 )
 from zabob.common.click_types import (
     OptionalType, SemVerParamType, OrType, NoneType,
@@ -95,6 +97,8 @@ __all__ = (
     "check_pid",
     "exec_cmd",
     "CompletedProcess",
+    "SpawnerPool",
+    "spawner_pool",
     "OptionalType",
     "SemVerParamType",
     "OrType",
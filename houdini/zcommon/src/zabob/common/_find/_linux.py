@@ -10,19 +10,24 @@ from semver import Version
 from zabob.common._find.types import (
     HoudiniInstall,
     _get_houdini_version, _group_by_major_minor,
+    _memoize_by_state, _mtime,
     _parse_pyversion, _version,
 )
 
 
+_BASE_DIR = Path('/opt')
+'Where Houdini is installed on Linux.'
+
+
+@_memoize_by_state(lambda: _mtime(_BASE_DIR))
 def find_installations() -> dict[Version, HoudiniInstall]:
     """Find Houdini installations on Linux systems."""
     # installations: dict[str, HoudiniInstall] = {}
     # Common Linux installation paths
 
-    base_dir = Path('/opt')
     installations = {
         install.houdini_version: install
-        for version_dir in base_dir.glob('hfs*.*')
+        for version_dir in _BASE_DIR.glob('hfs*.*')
         for install in _process_installation(version_dir)
     }
 
@@ -5,6 +5,7 @@ This module contains functions to locate Houdini installations on macOS systems.
 from collections.abc import Iterable
 from contextlib import suppress
 from pathlib import Path
+import os
 import re
 
 from semver import Version
@@ -12,14 +13,20 @@ from semver import Version
 from zabob.common._find.types import (
     HoudiniInstall,
     _get_houdini_version,
-    _group_by_major_minor,
+    _get_major_minor,
+    _memoize_by_state,
+    _mtime,
     _parse_pyversion,
 )
 
 
-_RE_APP_NAME = re.compile(r'^(?:Houdini ?)(.*\D) *(\d+\.\d+\.\d+).app$')
+_RE_APP_NAME = re.compile(r'^(?:Houdini ?)(.*\D) *(\d+\.\d+\.\d+).app$', re.ASCII)
 
+_BASE_DIR = Path('/Applications/Houdini')
+'Where Houdini is installed on macOS.'
 
+
+@_memoize_by_state(lambda: _mtime(_BASE_DIR))
 def find_installations() -> dict[Version, HoudiniInstall]:
     '''
     Find Houdini installations on macOS systems.
@@ -36,39 +43,37 @@ def find_installations() -> dict[Version, HoudiniInstall]:
     # this layout to allow smooth upgrades and multiple versions.
     # The Houdini launcher will also create a symlink in /Applications/Houdini/Current
     # to the latest version, so we can use that to find the latest build.
-    base_dir = Path('/Applications/Houdini')
-    if not base_dir.exists():
-        return {}
-
-
-    installations = {
-        install.houdini_version: install
-        for version_dir in base_dir.glob('Houdini*.*')
-        for install in _process_installation(version_dir)
-    }
+    installations: dict[Version, HoudiniInstall] = {}
+    # The latest build seen so far for each major.minor version.
+    latest: dict[Version, HoudiniInstall] = {}
+    for version_dir in _find_version_dirs(_BASE_DIR):
+        for install in _process_installation(version_dir):
+            installations[install.houdini_version] = install
+            major_minor = _get_major_minor(install.houdini_version)
+            current = latest.get(major_minor)
+            if current is None or install.houdini_version > current.houdini_version:
+                latest[major_minor] = install
 
     # Add in the latest builds for each major.minor version
-    return installations | {
-            v: max(installs, key=lambda i: i.houdini_version)
-            for v, installs in _group_by_major_minor(installations).items()
-        }
+    return installations | latest
 
 
 def _process_installation(version_dir: Path) -> Iterable[HoudiniInstall]:
     """
     Process a potential Houdini installation directory.
     """
-    # Validate the directory structure
+    # Validate the directory structure.
+    # is_dir() is a single stat, and is False for missing paths.
     if not version_dir.is_dir():
         return
     frameworks = version_dir / "Frameworks"
-    if not frameworks.exists() or not frameworks.is_dir():
+    if not frameworks.is_dir():
         return
     hfs_dir = frameworks / 'Houdini.framework/Resources'
-    if not hfs_dir.exists() or not hfs_dir.is_dir():
+    if not hfs_dir.is_dir():
         return
     bin_dir = hfs_dir / 'bin'
-    if not bin_dir.exists() or not bin_dir.is_dir():
+    if not bin_dir.is_dir():
         return
     hython_path = bin_dir / "hython"
     if not hython_path.exists():
@@ -79,13 +84,11 @@ def _process_installation(version_dir: Path) -> Iterable[HoudiniInstall]:
     # but that would be hard to apply cross-platform and probably not useful.
     # But the apps are user-visible artifacts that may be discussed.
     app_paths = {
-        m.group(1).strip(): app
+        name: app
         for app_dir in (version_dir,
                         version_dir / 'Utilities',
                         version_dir / 'Administrative Tools')
-        for app in app_dir.glob("*.app")
-        for m in (_RE_APP_NAME.match(app.name),)
-        if m is not None
+        for name, app in _find_apps(app_dir)
     }
 
 
@@ -95,12 +98,12 @@ def _process_installation(version_dir: Path) -> Iterable[HoudiniInstall]:
 
         # Pick the highest version of Python 3.x libs. We don't need to ask for the exact
         # version; we can do that later if we need it. Startimg hython is expensive.
+        # Tuples compare on the version first, so no key function is needed.
         hy_version, lib_dir = max((
                                 (v, dir)
                                 for dir in hfs_dir.glob('houdini/python*.*libs')
                                 for v in _parse_pyversion(dir)
                             ),
-            key=lambda p: p[0],
             default=(Version(0), hfs_dir),
         )
         py_release = f'{hy_version.major}.{hy_version.minor}'
@@ -154,6 +157,37 @@ def _process_installation(version_dir: Path) -> Iterable[HoudiniInstall]:
             ),
         )
 
+def _find_version_dirs(base_dir: Path) -> Iterable[Path]:
+    """
+    Find the candidate version directories (Houdini*.*) directly within `base_dir`.
+
+    A single directory scan, filtering on the name before touching the entry.
+    The 'Current' symlink is not matched, so the latest build isn't seen twice.
+    """
+    with suppress(FileNotFoundError, NotADirectoryError), os.scandir(base_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.startswith('Houdini') or '.' not in name:
+                continue
+            if entry.is_dir():
+                yield Path(entry.path)
+
+
+def _find_apps(app_dir: Path) -> Iterable[tuple[str, Path]]:
+    """
+    Find the Houdini apps directly within `app_dir`, as (name, path) pairs.
+
+    A single directory scan; a missing directory has no apps.
+    """
+    with suppress(FileNotFoundError, NotADirectoryError), os.scandir(app_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.app'):
+                continue
+            m = _RE_APP_NAME.match(entry.name)
+            if m is not None:
+                yield m.group(1).strip(), Path(entry.path)
+
+
 if __name__ == "__main__":
     # For testing purposes, we can run this module directly to see the installations found
     installations = find_installations()
@@ -2,79 +2,116 @@
 Find Houdini hiding on Windows
 '''
 
-from collections import defaultdict
 from collections.abc import Iterable
 from contextlib import suppress
 from pathlib import Path
 from itertools import chain
-from functools import reduce
 import os
 
 from semver import Version
 
 from zabob.common._find.types import (
     HoudiniInstall,
-    _get_houdini_version, _group_by_major_minor, _if_exists, _parse_pyversion,
+    _get_houdini_version, _parse_pyversion,
 )
-from zabob.common._find.types import _get_major_minor
-
-def _by_regkey():
-    try:
-        import winreg
-        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r'SOFTWARE\Side Effects Software') as key: # type: ignore
-            i = 0
-            while True:
-                try:
-                    version_key_name = winreg.EnumKey(key, i) # type: ignore
-                    with winreg.OpenKey(key, version_key_name) as version_key: # type: ignore
-                        try:
-                            install_path, _ = Path(winreg.QueryValueEx(version_key, 'InstallPath')) # type: ignore
-                            # Check if the installation path is valid
-                            # Process the installation
-                            yield install_path
-                        except OSError:
-                            pass
-                    i += 1
-                except OSError:
-                    break
-    except OSError:
-        pass
-
-def _by_directory():
-    """Find Houdini installations in standard directories."""
-    # Check the standard installation directories
+from zabob.common._find.types import _get_major_minor, _memoize_by_state, _mtime
+from zabob.common.common_utils import DEBUG
+
+_SESI_KEY = r'SOFTWARE\Side Effects Software'
+'Registry key (under HKEY_LOCAL_MACHINE) with a subkey per installed version.'
+
+_APP_NAMES = {
+    "GPlay": "gplay",
+    "Apprentice": "happrentice",
+    "Education": "heducation",
+    "Indie": "houdini_indie",
+    "FX": "houdinifx",
+    "Core": "houdinicore",
+    "Viewer": "hview",
+    "MPlayer": "mplay",
+}
+'Application names, and the executables (without .exe) that run them.'
+
+
+def _by_regkey() -> Iterable[Path]:
+    """Find Houdini installations listed in the registry."""
+    import winreg
+    with suppress(OSError), winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _SESI_KEY) as key: # type: ignore
+        enum_key, open_key, query_value = winreg.EnumKey, winreg.OpenKey, winreg.QueryValueEx # type: ignore
+        # Get the number of subkeys up front, rather than enumerating until we fail.
+        subkey_count = winreg.QueryInfoKey(key)[0] # type: ignore
+        for i in range(subkey_count):
+            with suppress(OSError), open_key(key, enum_key(key, i)) as version_key:
+                install_path, _ = query_value(version_key, 'InstallPath')
+                yield Path(install_path)
+
+
+def _regkey_mtime() -> int:
+    """The last-write time of the registry key, or 0 if it does not exist."""
+    import winreg
+    with suppress(OSError), winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _SESI_KEY) as key: # type: ignore
+        return winreg.QueryInfoKey(key)[2] # type: ignore
+    return 0
+
+
+def _base_dir() -> Path:
+    """The standard installation directory."""
     program_files = os.environ.get('PROGRAMFILES', r'C:\Program Files')
-    base_dir = Path(program_files) / 'Side Effects Software'
-    if not base_dir.exists():
-        return
+    return Path(program_files) / 'Side Effects Software'
+
 
-    for houdini_dir in base_dir.glob('Houdini*'):
-        if houdini_dir.is_dir():
-            yield houdini_dir
+def _by_directory() -> Iterable[Path]:
+    """Find Houdini installations in standard directories."""
+    # Check the standard installation directory, in a single scan.
+    # Windows file names are case-insensitive.
+    with suppress(FileNotFoundError, NotADirectoryError), os.scandir(_base_dir()) as entries:
+        for entry in entries:
+            if entry.name.lower().startswith('houdini') and entry.is_dir():
+                yield Path(entry.path)
 
 
+@_memoize_by_state(lambda: (_regkey_mtime(), _mtime(_base_dir())))
 def find_installations() -> dict[Version, HoudiniInstall]:
-    """Find Houdini installations on Windows systems."""
-    installations: dict[Version, HoudiniInstall] = {
-        install.houdini_version:install
-        for path in chain(_by_regkey(), _by_directory())
-        for install in _process_installation(path)
-    }
-
-    latest_builds = reduce(lambda a, i: (a[i.houdini_version].append(i), a)[1],
-                            installations.values(),
-                            defaultdict(list))
-    latest_builds: dict[Version, list[HoudiniInstall]] = defaultdict(list)
-    # Group installations by major.minor version
-    for version, install in installations.items():
-        major_minor = _get_major_minor(version)
-        latest_builds[major_minor].append(install)
+    """
+    Find Houdini installations on Windows systems.
+
+    Installations are listed in the registry as well as the install directory,
+    so the scan is redone when either changes.
+    """
+    # The registry and the install directory usually list the same installations,
+    # so skip paths we've already seen. Windows paths are case-insensitive.
+    # (Registry entries may be stale, so avoid resolve(), which would touch the disk.)
+    seen: set[str] = set()
+    installations: dict[Version, HoudiniInstall] = {}
+    # The latest build seen so far for each major.minor version.
+    latest: dict[Version, HoudiniInstall] = {}
+    for path in chain(_by_regkey(), _by_directory()):
+        key = os.path.normpath(path).casefold()
+        if key in seen:
+            continue
+        seen.add(key)
+        for install in _process_installation(path):
+            installations[install.houdini_version] = install
+            major_minor = _get_major_minor(install.houdini_version)
+            current = latest.get(major_minor)
+            if current is None or install.houdini_version > current.houdini_version:
+                latest[major_minor] = install
 
     # Add in the latest builds for each major.minor version
-    return installations | {
-            v: max(installs, key=lambda i: i.houdini_version)
-            for v, installs in _group_by_major_minor(installations).items()
-        }
+    return installations | latest
+
+def _find_python_libs(houdini_dir: Path) -> Iterable[tuple[Version, Path]]:
+    """Find the python*.*libs directories in `houdini_dir`, with their Python versions."""
+    with suppress(FileNotFoundError, NotADirectoryError), os.scandir(houdini_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            # Cheap prefilter; Windows names are case-insensitive, as is the full match.
+            lower = name.lower()
+            if not lower.startswith('python') or not lower.endswith('libs'):
+                continue
+            for version in _parse_pyversion(name):
+                if entry.is_dir():
+                    yield version, Path(entry.path)
 
 def _process_installation(version_dir: Path) -> Iterable[HoudiniInstall]:
     """Process a potential Houdini installation directory."""
@@ -84,88 +121,80 @@ def _process_installation(version_dir: Path) -> Iterable[HoudiniInstall]:
     if not hython_path.exists():
         return
 
-    with suppress(TypeError, ValueError):
-        # If we can't parse this version, we skip this installation.
-        # Extract version from directory name or hython
+    # If we can't parse this version, we skip this installation.
+    try:
         houdini_version = _get_houdini_version(version_dir.name)
-        if houdini_version.major == 0:
-            return
-
-        # Find Python lib dirs using glob
-        py_version, lib_dir = max((
-                            (version, path)
-                            for path in version_dir.glob('houdini/python*.*libs')
-                            for version in _parse_pyversion(path)
-                            ),
-                    key=lambda p: p[0],
-                    default=(Version(0), version_dir),
-                )
-        if py_version.major < 3:
-            return
-
-        app_names ={
-            "GPlay": "gplay",
-            "Apprentice": "happrentice",
-            "Education": "heducation",
-            "Indie": "houdini_indie",
-            "FX": "houdinifx",
-            "Core": "houdinicore",
-            "Viewer": "hview",
-            "MPlayer": "mplay",
-        }
-
-        app_paths = {
-            app_name: exe
-            for app_name, file in app_names.values()
-            for exe in _if_exists(version_dir / file, '.exe')
-        }
-        py_release = f'{py_version.major}.{py_version.minor}'
-        libname = f'python{py_release}libs'
-        hfs_dir = version_dir
-        exec_prefix = hfs_dir / 'python'
-        # Create installation entry
-        # TODO: Windows install dir layout is just a guess for now
-        yield HoudiniInstall(
-            houdini_version=houdini_version,
-            python_version=py_version,
-            version_dir=version_dir, # TODO: Verify this
-            exec_prefix=version_dir,
-            hfs_dir=hfs_dir,
-            bin_dir=bin_dir,
-            hython=hython_path,
-            python_libs=lib_dir,
-            hdso_libs= hfs_dir / 'dsolib',
-            hh_dir=version_dir / 'houdini',
-            toolkit_dir=version_dir / 'toolkit',
-            config_dir=version_dir / 'config',
-            sbin_dir=version_dir / 'sbin',
-            app_paths=app_paths,
-            lib_paths= tuple((
-               *(p
-                    for glob in (
-                        f'houdini/{libname}',
-                        f'packages/*/{libname}',
-                        )
-                    for p in hfs_dir.glob(glob)
-                    if p.is_dir()
-                ),
-               *(p
-                    for p in (
-                        lib_dir,
-                        lib_dir / 'site-packages',
-                        lib_dir / 'site-packages-forced',
-                        lib_dir / 'site-packages-ui-forced',
+    except (TypeError, ValueError):
+        DEBUG(f"Skipping {version_dir}: unparseable version")
+        return
+    if houdini_version.major == 0:
+        return
+
+    # Find Python lib dirs. 'houdini' is a literal directory, so scan just it,
+    # matching on the names before constructing any paths.
+    py_version, lib_dir = max(
+                _find_python_libs(version_dir / 'houdini'),
+                default=(Version(0), version_dir),
+            )
+    if py_version.major < 3:
+        return
+
+    # One directory scan, rather than a stat per application.
+    # Windows file names are case-insensitive.
+    with os.scandir(version_dir) as entries:
+        present = {entry.name.lower() for entry in entries if entry.is_file()}
+    app_paths = {
+        app_name: version_dir / f'{file}.exe'
+        for app_name, file in _APP_NAMES.items()
+        if f'{file}.exe' in present
+    }
+    py_release = f'{py_version.major}.{py_version.minor}'
+    libname = f'python{py_release}libs'
+    hfs_dir = version_dir
+    exec_prefix = hfs_dir / 'python'
+    # Create installation entry
+    # TODO: Windows install dir layout is just a guess for now
+    yield HoudiniInstall(
+        houdini_version=houdini_version,
+        python_version=py_version,
+        version_dir=version_dir, # TODO: Verify this
+        exec_prefix=version_dir,
+        hfs_dir=hfs_dir,
+        bin_dir=bin_dir,
+        hython=hython_path,
+        python_libs=lib_dir,
+        hdso_libs= hfs_dir / 'dsolib',
+        hh_dir=version_dir / 'houdini',
+        toolkit_dir=version_dir / 'toolkit',
+        config_dir=version_dir / 'config',
+        sbin_dir=version_dir / 'sbin',
+        app_paths=app_paths,
+        lib_paths= tuple((
+           *(p
+                for glob in (
+                    f'houdini/{libname}',
+                    f'packages/*/{libname}',
                     )
-                    if p.is_dir()
-               ),
-            )),
-            env_path=tuple(
-                p
+                for p in hfs_dir.glob(glob)
+                if p.is_dir()
+            ),
+           *(p
                 for p in (
-                        bin_dir,
-                        exec_prefix / 'bin',
-                        hfs_dir / 'toolkit/bin',
+                    lib_dir,
+                    lib_dir / 'site-packages',
+                    lib_dir / 'site-packages-forced',
+                    lib_dir / 'site-packages-ui-forced',
                 )
                 if p.is_dir()
-            ),
-        )
+           ),
+        )),
+        env_path=tuple(
+            p
+            for p in (
+                    bin_dir,
+                    exec_prefix / 'bin',
+                    hfs_dir / 'toolkit/bin',
+            )
+            if p.is_dir()
+        ),
+    )
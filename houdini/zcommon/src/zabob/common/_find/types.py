@@ -1,14 +1,24 @@
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Callable, Hashable, Iterable
 from dataclasses import dataclass
-from functools import reduce
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Sequence
+import os
+from typing import Sequence, TypeAlias
 from semver import Version
 import re
 
 
-_RE_DIR_NAME = re .compile (r'^(?:Houdini ?)(\d+\.\d+(?:\.\d+)?)$', re.IGNORECASE)
+_RE_VERSIONED_NAME = re.compile(
+    r'Houdini ?(?P<houdini>\d+\.\d+(?:\.\d+)?)'
+    r'|python(?P<python>\d+\.\d+)libs',
+    re.IGNORECASE,
+)
+'''
+Houdini version directory names (Houdini20.5.584) and Python library directory
+names (python3.11libs), matched with fullmatch(). The named group that matched
+says which it was.
+'''
 
 ###
 # Note to Copilot:
@@ -67,6 +77,13 @@ def _version(version: str|Version) -> Version:
     """Convert version string to semver.Version object."""
     if isinstance(version, Version):
         return version
+    # Fast path for the plain M, M.m and M.m.p forms of Houdini and Python versions,
+    # skipping semver's full regex for pre-release and build metadata.
+    # Leading zeros are left for semver to reject.
+    parts = version.split('.')
+    if len(parts) <= 3 and all(p.isascii() and p.isdigit() and (p == '0' or p[0] != '0')
+                               for p in parts):
+        return Version(*map(int, parts))
     return Version.parse(version, True)
 
 # Add other shared utility functions
@@ -76,13 +93,13 @@ def _get_houdini_version(name_hint: str) -> Version:
 
     Note: hython does not report the version of Houdini, only Python."""
 
-    m = _RE_DIR_NAME.match(name_hint)
-    if m:
+    m = _RE_VERSIONED_NAME.fullmatch(name_hint)
+    if m and m['houdini']:
         # Extract version from app name
-        version_str = m.group(1)
-        return _version(version_str)
+        return _version(m['houdini'])
     return Version(0)
 
+@lru_cache(maxsize=128)
 def _get_major_minor(version: str|Version) -> Version:
     """Extract major.minor version from full version string."""
     v = _version(version)
@@ -92,41 +109,60 @@ def _group_by_major_minor(
     installations: dict[Version, HoudiniInstall]
 ) -> dict[Version, list[HoudiniInstall]]:
     """Group installations by major.minor version."""
-    def by_major_minor(a: dict[Version, list[HoudiniInstall]], i: HoudiniInstall) -> dict[Version, list[HoudiniInstall]]:
-        major_minor = _get_major_minor(i.houdini_version)
-        a[major_minor].append(i)
-        return a
-    return reduce(by_major_minor,
-                installations.values(),
-                defaultdict(list))
+    groups: dict[Version, list[HoudiniInstall]] = defaultdict(list)
+    for install in installations.values():
+        groups[_get_major_minor(install.houdini_version)].append(install)
+    return groups
 
 
-def _if_exists(path: Path, suffix: str|None = None):
+def _parse_pyversion(path: Path|str) -> Iterable[Version]:
     """
-    Check if the path exists.
+    Parse Python version from library directory name.
 
     Args:
-    The path to check.
-    suffix: Optional suffix to add to the path.
-
+    path: The path to check, or just its name.
     Yields:
-    The path if it exists, otherwise nothing.
+    A tuple of Python version and the path, if it matches the pattern.
     """
-    if suffix is not None:
-        path = path.with_suffix(suffix)
-    if path.exists():
-        yield path
+    name = path if isinstance(path, str) else path.name
+    py_match = _RE_VERSIONED_NAME.fullmatch(name)
+    if py_match and py_match['python']:
+        yield _version(py_match['python'])
+
+
+def _mtime(path: Path) -> int|None:
+    """The modification time of `path`, or `None` if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
 
+_Scan: TypeAlias = Callable[[], dict[Version, HoudiniInstall]]
+'A scan for Houdini installations.'
 
-def _parse_pyversion(path: Path) -> Iterable[Version]:
+
+def _memoize_by_state(state: Callable[[], Hashable]) -> Callable[[_Scan], _Scan]:
     """
-    Parse Python version from library directory name.
+    Memoize a scan for installations, redoing it only when `state()` changes.
 
-    Args:
-    path: The path to check.
-    Yields:
-    A tuple of Python version and the path, if it matches the pattern.
+    `state()` returns the modification times of what the scan looks at, e.g.
+    the base directory. Installing or removing a version adds or removes an
+    entry there, which updates it. If `state()` returns `None`, there is
+    nothing to scan, and no installations are found.
+
+    Each caller gets its own copy of the result.
     """
-    py_match = re.match(r'^python(\d+\.\d+)libs$', path.name, re.IGNORECASE)
-    if py_match:
-        yield _version(py_match.group(1))
+    def decorator(scan: _Scan) -> _Scan:
+        cache: tuple[Hashable, dict[Version, HoudiniInstall]] | None = None
+        @wraps(scan)
+        def wrapper() -> dict[Version, HoudiniInstall]:
+            nonlocal cache
+            key = state()
+            if key is None:
+                return {}
+            if cache is None or cache[0] != key:
+                cache = (key, scan())
+            return dict(cache[1])
+        return wrapper
+    return decorator
@@ -10,11 +10,17 @@ the context of a command line interface (CLI).
 
 from collections.abc import Sequence
 from contextlib import suppress
-from shutil import which
+from functools import cache
+from shutil import copyfileobj, which
 from typing import Any, TYPE_CHECKING, Never
 from pathlib import Path
 import os
+import pickle
+import signal
+import socket
 import subprocess
+import threading
+import time
 # For re-export for consistency
 from subprocess import CompletedProcess
 
@@ -42,6 +48,188 @@ def debug_cmd(cmd: Sequence[str],
                 DEBUG(f"Env:  {key}={value}")
         DEBUG(f"Command: {' '.join(cmd)}")
 
+
+SPAWN_POOL_ENV = 'ZABOB_SPAWN_POOL'
+'''
+Environment variable that enables the `SpawnerPool` for `run` when set to `1`.
+'''
+
+
+def _spawner_loop(sock: socket.socket) -> Never:
+    """
+    Body of a spawner helper process.
+
+    Reads pickled `(argv, env, cwd)` requests from the socket, launches each
+    via fork+execve, and writes back the exit code. Exits when the parent
+    closes its end of the socket, or on any error decoding a request; the
+    helper must never unwind into the parent's code.
+    """
+    with sock, sock.makefile('rwb') as stream:
+        while True:
+            try:
+                argv, env, cwd = pickle.load(stream)
+            except BaseException:
+                os._exit(0)
+            try:
+                pid = os.fork()
+                if pid == 0:
+                    try:
+                        signal.signal(signal.SIGINT, signal.SIG_DFL)
+                        signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+                        if cwd is not None:
+                            os.chdir(cwd)
+                        os.execve(argv[0], argv, env)
+                    finally:
+                        os._exit(127)
+                _, status = os.waitpid(pid, 0)
+                returncode = os.waitstatus_to_exitcode(status)
+            except OSError:
+                returncode = 127
+            pickle.dump(returncode, stream)
+            stream.flush()
+
+
+_CLOSE_TIMEOUT = 1.0
+'''
+Seconds to wait for a busy spawner helper to finish before terminating it.
+'''
+
+
+class _Spawner:
+    """
+    A single forked helper process, connected by a UNIX-domain socket pair.
+    """
+    def __init__(self) -> None:
+        parent, child = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        pid = os.fork()
+        if pid == 0:
+            try:
+                # Ctrl-C is for the parent; it decides whether to shut us down.
+                signal.signal(signal.SIGINT, signal.SIG_IGN)
+                parent.close()
+                _spawner_loop(child)
+            finally:
+                os._exit(1)
+        child.close()
+        self.pid = pid
+        self.sock = parent
+        self.stream = parent.makefile('rwb')
+
+    def call(self, cmd: Sequence[str], env: dict[str, str], cwd: str|None) -> int:
+        """Have the helper run the command, and wait for its exit code."""
+        pickle.dump((list(cmd), env, cwd), self.stream)
+        self.stream.flush()
+        return pickle.load(self.stream)
+
+    def close(self, timeout: float=_CLOSE_TIMEOUT) -> None:
+        """
+        Shut down the helper process.
+
+        An idle helper exits as soon as it sees EOF. One still waiting on a
+        command is given `timeout` seconds, then terminated; the command
+        itself is left to run to completion.
+        """
+        with suppress(OSError):
+            # Later helpers inherit our end of the socket, so closing it
+            # would not signal EOF; shutdown() does.
+            self.sock.shutdown(socket.SHUT_RDWR)
+        with suppress(OSError):
+            self.stream.close()
+            self.sock.close()
+        with suppress(ChildProcessError):
+            deadline = time.monotonic() + timeout
+            while os.waitpid(self.pid, os.WNOHANG) == (0, 0):
+                if time.monotonic() >= deadline:
+                    with suppress(ProcessLookupError):
+                        os.kill(self.pid, signal.SIGTERM)
+                    os.waitpid(self.pid, 0)
+                    break
+                time.sleep(0.01)
+
+
+class SpawnerPool:
+    """
+    A pool of pre-forked helper processes that launch commands for us.
+
+    Forking a large process (such as one that has loaded Houdini's modules)
+    is expensive. The helpers are forked once, and thereafter fork+exec each
+    command on our behalf, so repeated short commands only pay for the small
+    helper's fork.
+
+    Only commands with inherited stdio and no shell are routed through the pool;
+    see `run`. Enabled by setting `ZABOB_SPAWN_POOL=1` on POSIX systems.
+    The pool is started by the first pooled `run`; call `spawner_pool` early
+    to fork the helpers while this process is still small. The helpers keep
+    the stdin, stdout and stderr this process had at that time.
+    """
+    def __init__(self, size: int=2):
+        """
+        Args:
+            size (int): The number of helpers to pre-fork.
+        """
+        self._lock = threading.Condition()
+        self._all: list[_Spawner] = [_Spawner() for _ in range(size)]
+        self._idle: list[_Spawner] = list(self._all)
+
+    def run(self,
+            cmd: Sequence[str],
+            env: dict[str, str],
+            cwd: str|None=None,
+        ) -> int|None:
+        """
+        Run the command in a pooled helper, returning its exit code.
+
+        If all helpers are busy, waits for one to become free; the pool never
+        forks again after it is created, since that is the expense it avoids.
+        If a call fails or is interrupted, that helper is shut down and dropped,
+        as its end of the protocol can no longer be trusted. Returns `None` if
+        no helpers remain, so the caller can fall back to `subprocess`.
+        """
+        with self._lock:
+            self._lock.wait_for(lambda: self._idle or not self._all)
+            if not self._idle:
+                return None
+            spawner = self._idle.pop()
+        try:
+            returncode = spawner.call(cmd, env, cwd)
+        except BaseException:
+            with self._lock:
+                with suppress(ValueError):
+                    self._all.remove(spawner)
+                self._lock.notify_all()
+            spawner.close()
+            raise
+        with self._lock:
+            self._idle.append(spawner)
+            self._lock.notify()
+        return returncode
+
+    def close(self) -> None:
+        """Shut down all the helper processes."""
+        with self._lock:
+            spawners = list(self._all)
+            self._all.clear()
+            self._idle.clear()
+            self._lock.notify_all()
+        for spawner in spawners:
+            spawner.close()
+
+
+@cache
+def spawner_pool() -> SpawnerPool|None:
+    """
+    Get the process-wide `SpawnerPool`, or `None` if it is not enabled.
+
+    The pool is created on the first call.
+    """
+    if os.name != 'posix' or os.environ.get(SPAWN_POOL_ENV) != '1':
+        return None
+    import atexit
+    pool = SpawnerPool()
+    atexit.register(pool.close)
+    return pool
+
+
 def run(*cmds: Any,
         cwd: os.PathLike|str|None=None,
         env: dict[str,str]|None=None,
@@ -53,21 +241,33 @@ def run(*cmds: Any,
     "Run the given command."
     cmd = [str(arg) for arg in cmds]
     cmd[0] = which(cmd[0]) or cmd[0]
-    cwd = Path(cwd or Path.cwd())
-    DEBUG(f"{cwd.name}> {' '.join(cmd)}")
-    debug_cmd(cmd, cwd, env)
+    cwd_str = os.fspath(cwd) if cwd else None
+    if DEBUG.enabled:
+        display = Path(cwd_str).name if cwd_str else os.path.basename(os.getcwd())
+        DEBUG(f"{display}> {' '.join(cmd)}")
+        debug_cmd(cmd, cwd_str, env)
     if dry_run:
         return subprocess.CompletedProcess(cmd, 0)
     env = env or os.environ.copy()
-    result: subprocess.CompletedProcess = subprocess.run(cmd,
-                                                        cwd=str(cwd) if cwd is not None else None,
-                                                        env=env,
-                                                        shell=shell,
-                                                        stderr=stderr,
-                                                        stdout=stdout,
-                                                        )
-    if result.returncode != 0:
-        raise RuntimeError(f"Command exited with return code {result.returncode}.")
+    pool = spawner_pool()
+    if pool is not None and not shell and stdout is None and stderr is None:
+        returncode = pool.run(cmd, env, cwd_str)
+        if returncode is not None:
+            if returncode != 0:
+                raise RuntimeError(f"Command exited with return code {returncode}.")
+            DEBUG("Command completed successfully.")
+            return subprocess.CompletedProcess(cmd, returncode)
+    try:
+        result: subprocess.CompletedProcess = subprocess.run(cmd,
+                                                            cwd=cwd_str,
+                                                            env=env,
+                                                            shell=shell,
+                                                            stderr=stderr,
+                                                            stdout=stdout,
+                                                            check=True,
+                                                            )
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Command exited with return code {e.returncode}.") from e
     DEBUG("Command completed successfully.")
     return result
 
@@ -81,14 +281,14 @@ def exec_cmd(*cmds: Any,
     "Run the given command, replacing this process."
     cmd = [str(arg) for arg in cmds]
     cmd[0] = which(cmd[0]) or cmd[0]
-    cwd = Path(cwd or Path.cwd())
-    DEBUG(f"{cwd.name}> {' '.join(cmd)}")
-    debug_cmd(cmd, cwd, env)
+    cwd_str = os.fspath(cwd) if cwd else None
+    if DEBUG.enabled:
+        display = Path(cwd_str).name if cwd_str else os.path.basename(os.getcwd())
+        DEBUG(f"{display}> {' '.join(cmd)}")
+        debug_cmd(cmd, cwd_str, env)
     env = env or os.environ.copy()
-    if shell:
-        DEBUG("Running command in shell mode.")
-    else:
-        DEBUG("Running command in non-shell mode.")
+    if DEBUG.enabled:
+        DEBUG(f"Running command in {'shell' if shell else 'non-shell'} mode.")
     os.execve(cmd[0], cmd, env)  #
 
 def capture(*cmds: Any,
@@ -98,29 +298,80 @@ def capture(*cmds: Any,
             stderr: '_FILE'=None,
             cwd: os.PathLike|str|None=None,
             **kwargs) -> str:
-    "Capture the output of the given command."
+    """
+    Capture the output of the given command.
+
+    If `stdout` is a file object, the output is streamed into it in fixed-size
+    chunks, without decoding, and an empty string is returned.
+    """
     cmd = [str(arg) for arg in cmds]
     cmd[0] = which(cmd[0]) or cmd[0]
     env = env or os.environ.copy()
     debug_cmd(cmd, cwd, env)
-    result: subprocess.CompletedProcess = subprocess.run(cmd,
-                                                        cwd=str(cwd) if cwd is not None else None,
-                                                        capture_output=True,
-                                                        text=True,
-                                                        env=env,
-                                                        shell=shell,
-                                                        stdout=stdout,
-                                                        stderr=stderr,
-                                                        **kwargs
-                                                        )
-    if result.returncode != 0:
-        raise RuntimeError(f"Command exited with return code {result.returncode}.")
+    if hasattr(stdout, 'write'):
+        _copy_output(cmd, stdout,
+                     cwd=cwd,
+                     env=env,
+                     shell=shell,
+                     stderr=stderr,
+                     **kwargs)
+        DEBUG("Command completed successfully.")
+        return ''
+    try:
+        result: subprocess.CompletedProcess = subprocess.run(cmd,
+                                                            cwd=str(cwd) if cwd is not None else None,
+                                                            capture_output=True,
+                                                            text=True,
+                                                            env=env,
+                                                            shell=shell,
+                                                            stdout=stdout,
+                                                            stderr=stderr,
+                                                            check=True,
+                                                            **kwargs
+                                                            )
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Command exited with return code {e.returncode}.") from e
     DEBUG("Command completed successfully.")
     text = result.stdout
-    DEBUG(f"Command output: '{text}'")
+    if DEBUG.enabled:
+        DEBUG(f"Command output: '{text}'")
     return text
 
 
+_COPY_BUFSIZE = 64 * 1024
+
+
+def _copy_output(cmd: Sequence[str],
+                 out: Any,
+                 cwd: os.PathLike|str|None=None,
+                 env: dict[str,str]|None=None,
+                 shell: bool=False,
+                 stderr: '_FILE'=None,
+                 **kwargs) -> None:
+    """
+    Run the command, copying its stdout into the file object `out`.
+
+    Text files are written via their underlying binary buffer, so the output
+    is never decoded or held in memory all at once.
+    """
+    dest = getattr(out, 'buffer', out)
+    if dest is not out:
+        # Don't let our raw bytes overtake anything already buffered as text.
+        out.flush()
+    with subprocess.Popen(cmd,
+                          cwd=str(cwd) if cwd is not None else None,
+                          env=env,
+                          shell=shell,
+                          stdout=subprocess.PIPE,
+                          stderr=stderr,
+                          **kwargs
+                          ) as proc:
+        assert proc.stdout is not None
+        copyfileobj(proc.stdout, dest, _COPY_BUFSIZE)
+    if proc.returncode != 0:
+        raise RuntimeError(f"Command exited with return code {proc.returncode}.")
+
+
 def spawn(*cmds: Any,
             cwd: os.PathLike|str|None=None,
             env: dict[str,str]|None=None,
@@ -172,4 +423,6 @@ __all__ = (
     "check_pid",
     "exec_cmd",
     "CompletedProcess",
+    "SpawnerPool",
+    "spawner_pool",
 )
@@ -2,6 +2,7 @@
 Timer context manager for measuring execution time
 '''
 
+import os
 import time
 import sys
 from contextlib import contextmanager
@@ -9,13 +10,29 @@ from collections.abc import Callable, Generator
 from typing import Any
 
 
+TIMER_ENABLED: bool = os.environ.get('ZABOB_TIMER', '1') != '0'
+'''
+Whether `timer` reports anything. Set `ZABOB_TIMER=0` to disable timing output,
+skipping the formatting work entirely.
+'''
+
+
+def _no_update(tag: str, exception: Exception|None = None) -> None:
+    """The update function yielded when timing is disabled."""
+    pass
+
+
 @contextmanager
-def timer(label: str) -> Generator[Callable[..., None], Any, None]:
+def timer(label: str, flush: bool=False) -> Generator[Callable[..., None], Any, None]:
     """
     Context manager that reports elapsed time during execution with support for subtask updates.
 
+    Output is collected and written to stderr in a single write when the context exits,
+    so that timing a tight loop doesn't pay for a write per update.
+
     Args:
         label (str): A descriptive label to identify this timer in the output
+        flush (bool): If True, write each line as it is produced (useful for debugging)
 
     Yields:
         Callable: An update function that can be called to report intermediate timing results
@@ -38,10 +55,22 @@ def timer(label: str) -> Generator[Callable[..., None], Any, None]:
 
         # Output will show timing for each batch and overall total
     """
-    start_time = time.time()
+    if not TIMER_ENABLED:
+        yield _no_update
+        return
+    # Monotonic integer nanoseconds; converted to seconds only for display.
+    start_time = time.perf_counter_ns()
     previous_time = start_time
     previous_tag = None
     has_updates = False
+    lines: list[str] = []
+
+    def emit(line: str) -> None:
+        """Write a line to stderr now, or buffer it until exit."""
+        if flush:
+            print(line, file=sys.stderr)
+        else:
+            lines.append(line + "\n")
 
     def update(tag: str, exception: Exception|None = None) -> None:
         """Report timing for a subtask and start timing a new one.
@@ -52,53 +81,53 @@ def timer(label: str) -> Generator[Callable[..., None], Any, None]:
         """
         nonlocal previous_time, previous_tag, has_updates
 
-        current_time = time.time()
-        elapsed = current_time - previous_time
+        current_time = time.perf_counter_ns()
 
         if previous_tag is not None:
+            elapsed = (current_time - previous_time) / 1e9
             if exception is None:
-                print(f"{label} - {previous_tag}: completed in {elapsed:.4f} seconds", file=sys.stderr)
+                emit(f"{label} - {previous_tag}: completed in {elapsed:.4f} seconds")
             else:
-                print(f"{label} - {previous_tag}: failed after {elapsed:.4f} seconds - {type(exception).__name__}: {exception}",
-                      file=sys.stderr)
+                emit(f"{label} - {previous_tag}: failed after {elapsed:.4f} seconds - {type(exception).__name__}: {exception}")
 
         previous_tag = tag
         previous_time = current_time
         has_updates = True
 
     try:
-        print(f"{label}: started", file=sys.stderr)
+        emit(f"{label}: started")
         yield update
 
         # Handle final subtask if there was one
         if has_updates and previous_tag is not None:
-            end_time = time.time()
-            subtask_elapsed = end_time - previous_time
-            print(f"{label} - {previous_tag}: completed in {subtask_elapsed:.4f} seconds", file=sys.stderr)
+            end_time = time.perf_counter_ns()
+            subtask_elapsed = (end_time - previous_time) / 1e9
+            emit(f"{label} - {previous_tag}: completed in {subtask_elapsed:.4f} seconds")
 
         # Report total time
-        end_time = time.time()
-        total_elapsed = end_time - start_time
+        end_time = time.perf_counter_ns()
+        total_elapsed = (end_time - start_time) / 1e9
         if has_updates:
-            print(f"{label}: total completed in {total_elapsed:.4f} seconds", file=sys.stderr)
+            emit(f"{label}: total completed in {total_elapsed:.4f} seconds")
         else:
-            print(f"{label}: completed in {total_elapsed:.4f} seconds", file=sys.stderr)
+            emit(f"{label}: completed in {total_elapsed:.4f} seconds")
 
     except Exception as e:
-        end_time = time.time()
+        end_time = time.perf_counter_ns()
 
         # Handle final subtask if there was one
         if has_updates and previous_tag is not None:
-            subtask_elapsed = end_time - previous_time
-            print(f"{label} - {previous_tag}: failed after {subtask_elapsed:.4f} seconds - {type(e).__name__}: {e}",
-                  file=sys.stderr)
+            subtask_elapsed = (end_time - previous_time) / 1e9
+            emit(f"{label} - {previous_tag}: failed after {subtask_elapsed:.4f} seconds - {type(e).__name__}: {e}")
 
         # Report total time with failure
-        total_elapsed = end_time - start_time
+        total_elapsed = (end_time - start_time) / 1e9
         if has_updates:
-            print(f"{label}: total failed after {total_elapsed:.4f} seconds - {type(e).__name__}: {e}",
-                  file=sys.stderr)
+            emit(f"{label}: total failed after {total_elapsed:.4f} seconds - {type(e).__name__}: {e}")
         else:
-            print(f"{label}: failed after {total_elapsed:.4f} seconds - {type(e).__name__}: {e}",
-                  file=sys.stderr)
+            emit(f"{label}: failed after {total_elapsed:.4f} seconds - {type(e).__name__}: {e}")
         raise
+    finally:
+        if lines:
+            sys.stderr.write("".join(lines))
+            sys.stderr.flush()
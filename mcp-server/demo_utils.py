@@ -0,0 +1,18 @@
+"""
+Shared helpers for the demo scripts.
+"""
+
+from contextlib import contextmanager, redirect_stdout
+import io
+import sys
+
+@contextmanager
+def buffered_output():
+    """Collect everything printed in the block, and write it to stdout in one go."""
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            yield
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
@@ -4,49 +4,69 @@ Enhanced Demo: Zabob MCP Server with Live Documentation Integration
 Demonstrates how static database + live documentation = powerful learning tool
 """
 
+from contextlib import suppress
 import sys
 from pathlib import Path
+from typing import Any
 
 # Add the src directory to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
+_SCENARIOS: tuple[dict[str, Any], ...] = (
+    {
+        "title": "SOP Node Discovery with Live Examples",
+        "query": "Find deformation nodes and show me how to use them",
+        "static_response": ["lattice", "wiredeform", "twist", "bend"],
+        "enhanced_action": "🌐 Fetch SideFX lattice node documentation",
+        "enhanced_value": "Shows actual VEX examples, parameter explanations, workflow tips"
+    },
+    {
+        "title": "Python Function with Documentation Context",
+        "query": "How do I select primitives programmatically?",
+        "static_response": ["hou.Geometry.globPrims()", "hou.PrimGroup.add()"],
+        "enhanced_action": "🔍 Search 'Houdini Python geometry selection examples'",
+        "enhanced_value": "Returns code snippets, tutorials, common patterns"
+    },
+    {
+        "title": "PDG Workflow Learning Assistant",
+        "query": "I need to understand file dependencies in PDG",
+        "static_response": ["File (Dependency)", "filecompress (Node)"],
+        "enhanced_action": "📚 Fetch PDG documentation + tutorial links",
+        "enhanced_value": "Complete workflow examples, best practices, troubleshooting"
+    },
+    {
+        "title": "Real-time Problem Solving",
+        "query": "My attribute transfer isn't working, what am I missing?",
+        "static_response": ["hou.Geometry.addAttrib()", "hou.Point.setAttribValue()"],
+        "enhanced_action": "🔎 Search recent forum posts + documentation",
+        "enhanced_value": "Common gotchas, debugging tips, working examples"
+    }
+)
+
+_EXAMPLES: tuple[dict[str, str], ...] = (
+    {
+        "function": "hou.Geometry.globPrims()",
+        "static": "Function exists, returns primitive list",
+        "enhanced": "Fetch: Parameter docs + code examples + common patterns"
+    },
+    {
+        "function": "lattice SOP node",
+        "static": "Node type: deformation, inputs: 1-2",
+        "enhanced": "Fetch: VEX code examples + tutorial videos + parameter explanations"
+    },
+    {
+        "function": "PDG File dependency",
+        "static": "Registry entry: File (Dependency)",
+        "enhanced": "Fetch: Workflow tutorials + dependency patterns + troubleshooting guides"
+    }
+)
+
 def demo_enhanced_documentation():
     """Demo the enhanced documentation capabilities."""
     print("🚀 Enhanced Demo: Static Database + Live Documentation")
     print("=" * 60)
 
-    scenarios = [
-        {
-            "title": "SOP Node Discovery with Live Examples",
-            "query": "Find deformation nodes and show me how to use them",
-            "static_response": ["lattice", "wiredeform", "twist", "bend"],
-            "enhanced_action": "🌐 Fetch SideFX lattice node documentation",
-            "enhanced_value": "Shows actual VEX examples, parameter explanations, workflow tips"
-        },
-        {
-            "title": "Python Function with Documentation Context",
-            "query": "How do I select primitives programmatically?",
-            "static_response": ["hou.Geometry.globPrims()", "hou.PrimGroup.add()"],
-            "enhanced_action": "🔍 Search 'Houdini Python geometry selection examples'",
-            "enhanced_value": "Returns code snippets, tutorials, common patterns"
-        },
-        {
-            "title": "PDG Workflow Learning Assistant",
-            "query": "I need to understand file dependencies in PDG",
-            "static_response": ["File (Dependency)", "filecompress (Node)"],
-            "enhanced_action": "📚 Fetch PDG documentation + tutorial links",
-            "enhanced_value": "Complete workflow examples, best practices, troubleshooting"
-        },
-        {
-            "title": "Real-time Problem Solving",
-            "query": "My attribute transfer isn't working, what am I missing?",
-            "static_response": ["hou.Geometry.addAttrib()", "hou.Point.setAttribValue()"],
-            "enhanced_action": "🔎 Search recent forum posts + documentation",
-            "enhanced_value": "Common gotchas, debugging tips, working examples"
-        }
-    ]
-
-    for i, scenario in enumerate(scenarios, 1):
+    for i, scenario in enumerate(_SCENARIOS, 1):
         print(f"\n📋 Scenario {i}: {scenario['title']}")
         print("-" * 50)
         print(f"🎯 User Query: \"{scenario['query']}\"")
@@ -87,25 +107,7 @@ def demo_specific_enhancements():
     print(f"\n🎯 Specific Enhancement Examples")
     print("=" * 35)
 
-    examples = [
-        {
-            "function": "hou.Geometry.globPrims()",
-            "static": "Function exists, returns primitive list",
-            "enhanced": "Fetch: Parameter docs + code examples + common patterns"
-        },
-        {
-            "function": "lattice SOP node",
-            "static": "Node type: deformation, inputs: 1-2",
-            "enhanced": "Fetch: VEX code examples + tutorial videos + parameter explanations"
-        },
-        {
-            "function": "PDG File dependency",
-            "static": "Registry entry: File (Dependency)",
-            "enhanced": "Fetch: Workflow tutorials + dependency patterns + troubleshooting guides"
-        }
-    ]
-
-    for example in examples:
+    for example in _EXAMPLES:
         print(f"\n🔧 {example['function']}")
         print(f"   📊 Static: {example['static']}")
         print(f"   ✨ Enhanced: {example['enhanced']}")
@@ -166,21 +168,28 @@ def demo_implementation_roadmap():
 
 def main():
     """Run the enhanced demo overview."""
-    print("🎬 Zabob MCP Server: Enhanced Documentation Integration Demo")
-    print("=" * 65)
-    print("Transforming static database into live documentation assistant")
-
-    demo_enhanced_documentation()
-    demo_integration_architecture()
-    demo_specific_enhancements()
-    demo_target_audience_value()
-    demo_implementation_roadmap()
-
-    print(f"\n🚀 Next Steps:")
-    print("1. Enhance MCP server with fetch/search integration")
-    print("2. Update demo to showcase live documentation")
-    print("3. Target: 'PDG becomes approachable, not intimidating'")
-    print("\n✨ Vision: Static knowledge + Live docs + AI guidance = Learning acceleration")
+    # Buffer the output and write it in a few large chunks,
+    # rather than a line at a time on a terminal.
+    with suppress(AttributeError):
+        sys.stdout.reconfigure(line_buffering=False)
+    try:
+        print("🎬 Zabob MCP Server: Enhanced Documentation Integration Demo")
+        print("=" * 65)
+        print("Transforming static database into live documentation assistant")
+
+        demo_enhanced_documentation()
+        demo_integration_architecture()
+        demo_specific_enhancements()
+        demo_target_audience_value()
+        demo_implementation_roadmap()
+
+        print(f"\n🚀 Next Steps:")
+        print("1. Enhance MCP server with fetch/search integration")
+        print("2. Update demo to showcase live documentation")
+        print("3. Target: 'PDG becomes approachable, not intimidating'")
+        print("\n✨ Vision: Static knowledge + Live docs + AI guidance = Learning acceleration")
+    finally:
+        sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
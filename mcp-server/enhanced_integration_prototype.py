@@ -6,21 +6,128 @@ Shows how to extend current tools with web search and fetch capabilities
 
 import sys
 import asyncio
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
 from pathlib import Path
+import time
+from typing import Any
+
+import aiohttp
 
 # Add the src directory to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
+from zabob.mcp.database import HoudiniDatabase
+
+# Templates for the documentation lookups, filled in per result
+NODE_DOC_QUERY = "Houdini {} node documentation examples"
+NODE_DOC_URL = "https://www.sidefx.com/docs/houdini/nodes/sop/{}.html"
+FUNCTION_EXAMPLE_QUERY = "Houdini Python {} code examples tutorial"
+FUNCTION_DOC_URL = "https://www.sidefx.com/docs/houdini/hom/hou/{}.html"
+PDG_TUTORIAL_QUERY = "Houdini PDG {} tutorial workflow"
+PDG_DOC_URL = "https://www.sidefx.com/docs/houdini/tops/index.html"
+
+# Words too common to be worth searching the PDG registry for
+_STOPWORDS = frozenset({
+    "the", "a", "an", "for", "to", "of", "in", "on", "with",
+    "how", "do", "i", "my", "and", "or", "is", "what", "can",
+})
+
+class _AsyncTTLCache:
+    """
+    An LRU cache, with expiry, for the results of coroutines.
+
+    Concurrent requests for the same key share one task, so identical
+    lookups fanned out by asyncio.gather make only one request.
+    Failures are not cached. A shared task is cancelled once every caller
+    waiting on it has been cancelled.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, asyncio.Future]] = OrderedDict()
+        self._waiters: Counter[asyncio.Future] = Counter()
+
+    async def get(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached result for key, calling factory() to compute it if needed."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            task = entry[1]
+        else:
+            task = asyncio.ensure_future(factory())
+            self._entries[key] = (now + self.ttl, task)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        self._entries.move_to_end(key)
+        self._waiters[task] += 1
+        try:
+            # Shield the shared task, so one cancelled caller doesn't cancel it for all.
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done() and self._waiters[task] == 1:
+                # We were the last caller waiting, so no one wants the result.
+                task.cancel()
+                self._forget(key, task)
+            elif task.cancelled():
+                self._forget(key, task)
+            raise
+        except Exception:
+            self._forget(key, task)
+            raise
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        """Drop the entry for key, if it still holds task."""
+        if key in self._entries and self._entries[key][1] is task:
+            del self._entries[key]
+
+
 # Simulated enhanced tools (would integrate with actual MCP server)
 class EnhancedMCPTools:
     """Prototype showing enhanced MCP tools with documentation integration."""
 
     def __init__(self):
-        # These would be real MCP tools in actual implementation
-        self.web_search = self._mock_web_search
-        self.fetch_webpage = self._mock_fetch_webpage
-
-    def _mock_web_search(self, query):
+        self._session: aiohttp.ClientSession | None = None
+        # Repeated queries and URLs are answered from here, without going to the network.
+        self._search_cache = _AsyncTTLCache()
+        self._page_cache = _AsyncTTLCache()
+        self._db: HoudiniDatabase | None = None
+
+    @property
+    def db(self) -> HoudiniDatabase:
+        """The database, opened on first use and kept open for all the tools."""
+        if self._db is None:
+            self._db = HoudiniDatabase()
+        return self._db
+
+    async def __aenter__(self):
+        # One session for all tool calls, so connections to www.sidefx.com
+        # are kept alive and reused rather than set up for every fetch.
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, limit_per_host=8, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    async def web_search(self, query):
+        """Search the web, caching the results by query."""
+        # This would be a real MCP tool in actual implementation
+        return await self._search_cache.get(query, lambda: self._mock_web_search(query))
+
+    async def _mock_web_search(self, query):
         """Mock web search - would use real vscode-websearchforcopilot_webSearch tool."""
         return {
             "results": [
@@ -30,19 +137,82 @@ class EnhancedMCPTools:
             ]
         }
 
-    def _mock_fetch_webpage(self, url):
-        """Mock webpage fetch - would use real fetch_webpage tool."""
-        return f"Documentation content for {url} with examples and parameters..."
+    async def fetch_webpage(self, url, preview_bytes=4096):
+        """
+        Fetch the start of a webpage over the shared session, caching it by URL.
+
+        Only the first `preview_bytes` bytes are fetched; callers only show a preview.
+        """
+        try:
+            return await self._page_cache.get((url, preview_bytes),
+                                              lambda: self._get_text(url, preview_bytes))
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return f"Fetch error: {e}"
+
+    async def _get_text(self, url, preview_bytes):
+        if self._session is None:
+            raise RuntimeError("EnhancedMCPTools must be entered with 'async with' before fetching")
+        headers = {"Range": f"bytes=0-{preview_bytes - 1}"}
+        async with self._session.get(url, headers=headers) as response:
+            response.raise_for_status()
+            # The server may ignore the Range header, so stop reading at the limit regardless.
+            chunks = []
+            remaining = preview_bytes
+            while remaining > 0 and (chunk := await response.content.read(remaining)):
+                chunks.append(chunk)
+                remaining -= len(chunk)
+            return b"".join(chunks).decode(response.charset or "utf-8", errors="replace")
 
     async def enhanced_search_node_types(self, keyword, include_docs=True):
         """Enhanced node search with live documentation."""
         # Step 1: Get static database results (existing functionality)
-        from zabob.mcp.database import HoudiniDatabase
+        static_nodes = self.db.search_node_types(keyword, limit=5)
+        result = self._static_node_result(keyword, static_nodes)
 
-        with HoudiniDatabase() as db:
-            static_nodes = db.search_node_types(keyword, limit=5)
+        if include_docs and static_nodes:
+            # Step 2: Enhance with live documentation
+            # Enhance top 3 results, all at once rather than one after another
+            enhanced_results = await asyncio.gather(
+                *(self._enrich_node(node) for node in static_nodes[:3]),
+                return_exceptions=True
+            )
+            result["enhanced_results"] = [
+                r for r in enhanced_results if not isinstance(r, BaseException)
+            ]
 
-        result = {
+        return result
+
+    async def stream_search_node_types(self, keyword, include_docs=True):
+        """
+        Enhanced node search, yielding results as they become available.
+
+        Yields the static database results first, then each enhanced node
+        as soon as its documentation arrives, rather than waiting for the
+        slowest one. The enhanced nodes therefore come in completion order,
+        not rank order.
+        """
+        static_nodes = self.db.search_node_types(keyword, limit=5)
+        yield self._static_node_result(keyword, static_nodes)
+
+        if include_docs and static_nodes:
+            tasks = [asyncio.ensure_future(self._enrich_node(node)) for node in static_nodes[:3]]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    try:
+                        yield await next_done
+                    except Exception:
+                        # As with enhanced_search_node_types, skip nodes we couldn't enhance.
+                        continue
+            finally:
+                # If the caller stops early, cancel the rest. Their page fetches
+                # are cancelled too, unless another caller is waiting on them.
+                for task in tasks:
+                    task.cancel()
+
+    @staticmethod
+    def _static_node_result(keyword, static_nodes):
+        """The static database part of a node search result."""
+        return {
             "keyword": keyword,
             "static_results": [
                 {
@@ -55,40 +225,31 @@ class EnhancedMCPTools:
             "count": len(static_nodes)
         }
 
-        if include_docs and static_nodes:
-            # Step 2: Enhance with live documentation
-            enhanced_results = []
-
-            for node in static_nodes[:3]:  # Enhance top 3 results
-                enhanced_node = {
-                    "name": node.name,
-                    "category": node.category,
-                    "description": node.description
-                }
-
-                # Fetch live documentation
-                doc_query = f"Houdini {node.name} node documentation examples"
-                search_results = self.web_search(doc_query)
-                enhanced_node["documentation_links"] = search_results["results"]
-
-                # Try to fetch specific SideFX documentation
-                sidefx_url = f"https://www.sidefx.com/docs/houdini/nodes/sop/{node.name}.html"
-                doc_content = self.fetch_webpage(sidefx_url)
-                enhanced_node["live_documentation"] = doc_content[:200] + "..."
-
-                enhanced_results.append(enhanced_node)
+    async def _enrich_node(self, node):
+        """Add live documentation to a node type."""
+        enhanced_node = {
+            "name": node.name,
+            "category": node.category,
+            "description": node.description
+        }
 
-            result["enhanced_results"] = enhanced_results
+        # Fetch live documentation, and
+        # try to fetch specific SideFX documentation
+        doc_query = NODE_DOC_QUERY.format(node.name)
+        sidefx_url = NODE_DOC_URL.format(node.name)
+        search_results, doc_content = await asyncio.gather(
+            self.web_search(doc_query),
+            self.fetch_webpage(sidefx_url)
+        )
+        enhanced_node["documentation_links"] = search_results["results"]
+        enhanced_node["live_documentation"] = doc_content[:200] + "..."
 
-        return result
+        return enhanced_node
 
     async def enhanced_search_functions(self, keyword, include_examples=True):
         """Enhanced function search with code examples."""
         # Step 1: Static database query
-        from zabob.mcp.database import HoudiniDatabase
-
-        with HoudiniDatabase() as db:
-            static_functions = db.search_functions_by_keyword(keyword, limit=5)
+        static_functions = self.db.search_functions_by_keyword(keyword, limit=5)
 
         result = {
             "keyword": keyword,
@@ -104,46 +265,52 @@ class EnhancedMCPTools:
         }
 
         if include_examples and static_functions:
-            # Step 2: Get live examples and tutorials
-            enhanced_results = []
-
-            for func in static_functions[:3]:
-                enhanced_func = {
-                    "name": func.name,
-                    "module": func.module,
-                    "docstring": func.docstring
-                }
+            # Step 2: Get live examples and tutorials, for all of them at once
+            enhanced_results = await asyncio.gather(
+                *(self._enrich_function(func) for func in static_functions[:3]),
+                return_exceptions=True
+            )
+            result["enhanced_results"] = [
+                r for r in enhanced_results if not isinstance(r, BaseException)
+            ]
 
-                # Search for code examples
-                example_query = f"Houdini Python {func.name} code examples tutorial"
-                search_results = self.web_search(example_query)
-                enhanced_func["tutorial_links"] = search_results["results"]
+        return result
 
-                # Try to fetch official documentation
-                if func.module == "hou":
-                    doc_url = f"https://www.sidefx.com/docs/houdini/hom/hou/{func.name}.html"
-                    doc_content = self.fetch_webpage(doc_url)
-                    enhanced_func["official_documentation"] = doc_content[:300] + "..."
+    async def _enrich_function(self, func):
+        """Add code examples and documentation to a function."""
+        enhanced_func = {
+            "name": func.name,
+            "module": func.module,
+            "docstring": func.docstring
+        }
 
-                enhanced_results.append(enhanced_func)
+        # Search for code examples
+        example_query = FUNCTION_EXAMPLE_QUERY.format(func.name)
+        search = self.web_search(example_query)
 
-            result["enhanced_results"] = enhanced_results
+        # Try to fetch official documentation
+        if func.module == "hou":
+            doc_url = FUNCTION_DOC_URL.format(func.name)
+            search_results, doc_content = await asyncio.gather(
+                search,
+                self.fetch_webpage(doc_url)
+            )
+            enhanced_func["official_documentation"] = doc_content[:300] + "..."
+        else:
+            search_results = await search
+        enhanced_func["tutorial_links"] = search_results["results"]
 
-        return result
+        return enhanced_func
 
     async def enhanced_pdg_guidance(self, workflow_query):
         """Enhanced PDG assistance with workflow guidance."""
         # Step 1: Check PDG registry
-        from zabob.mcp.database import HoudiniDatabase
-
-        with HoudiniDatabase() as db:
-            # Extract keywords from query
-            keywords = workflow_query.lower().split()
-            relevant_entries = []
-
-            for keyword in keywords:
-                entries = db.search_pdg_registry(keyword, limit=3)
-                relevant_entries.extend(entries)
+        # Extract keywords from query, without noise words or duplicates
+        keywords = list(dict.fromkeys(
+            word for word in workflow_query.lower().split()
+            if len(word) > 2 and word not in _STOPWORDS
+        ))
+        relevant_entries = self.db.search_pdg_registry_multi(keywords, limit_per=3)
 
         result = {
             "query": workflow_query,
@@ -153,14 +320,14 @@ class EnhancedMCPTools:
             ]
         }
 
-        # Step 2: Get workflow tutorials and examples
-        tutorial_query = f"Houdini PDG {workflow_query} tutorial workflow"
-        search_results = self.web_search(tutorial_query)
+        # Step 2: Get workflow tutorials and examples, while
+        # Step 3: Fetching specific PDG documentation
+        tutorial_query = PDG_TUTORIAL_QUERY.format(workflow_query)
+        search_results, pdg_content = await asyncio.gather(
+            self.web_search(tutorial_query),
+            self.fetch_webpage(PDG_DOC_URL)
+        )
         result["workflow_tutorials"] = search_results["results"]
-
-        # Step 3: Fetch specific PDG documentation
-        pdg_doc_url = "https://www.sidefx.com/docs/houdini/tops/index.html"
-        pdg_content = self.fetch_webpage(pdg_doc_url)
         result["pdg_documentation_context"] = pdg_content[:400] + "..."
 
         return result
@@ -170,60 +337,64 @@ async def demo_enhanced_capabilities():
     print("🚀 Enhanced MCP Tools Demo with Live Documentation")
     print("=" * 55)
 
-    tools = EnhancedMCPTools()
-
-    # Demo 1: Enhanced node search
-    print("\n📋 Demo 1: Enhanced Node Search")
-    print("-" * 35)
-    result1 = await tools.enhanced_search_node_types("deform")
-
-    print(f"Query: 'deform' nodes")
-    print(f"Static results: {result1['count']} nodes found")
-    for node in result1['static_results'][:2]:
-        print(f"  • {node['name']} ({node['category']})")
-
-    if 'enhanced_results' in result1:
-        print(f"\n✨ Enhanced with documentation:")
-        for node in result1['enhanced_results'][:1]:
+    async with EnhancedMCPTools() as tools:
+        # Demo 1: Enhanced node search
+        print("\n📋 Demo 1: Enhanced Node Search")
+        print("-" * 35)
+        stream1 = tools.stream_search_node_types("deform")
+        result1 = await anext(stream1)
+
+        print(f"Query: 'deform' nodes")
+        print(f"Static results: {result1['count']} nodes found")
+        for node in result1['static_results'][:2]:
+            print(f"  • {node['name']} ({node['category']})")
+
+        # We only show one enhanced node, so take whichever is ready first.
+        # Closing the stream cancels the others, and with them any page
+        # fetches no one else is waiting for.
+        node = await anext(stream1, None)
+        await stream1.aclose()
+        if node is not None:
+            print(f"\n✨ Enhanced with documentation:")
             print(f"  📚 {node['name']} documentation:")
             for link in node['documentation_links'][:2]:
                 print(f"    • {link}")
             print(f"    📖 Live content preview: {node['live_documentation']}")
 
-    # Demo 2: Enhanced function search
-    print("\n\n📋 Demo 2: Enhanced Function Search")
-    print("-" * 37)
-    result2 = await tools.enhanced_search_functions("geometry")
+        # Demo 2: Enhanced function search
+        print("\n\n📋 Demo 2: Enhanced Function Search")
+        print("-" * 37)
+        result2 = await tools.enhanced_search_functions("geometry")
 
-    print(f"Query: 'geometry' functions")
-    print(f"Static results: {result2['count']} functions found")
-    for func in result2['static_results'][:2]:
-        print(f"  • {func['name']} ({func['module']})")
+        print(f"Query: 'geometry' functions")
+        print(f"Static results: {result2['count']} functions found")
+        for func in result2['static_results'][:2]:
+            print(f"  • {func['name']} ({func['module']})")
 
-    if 'enhanced_results' in result2:
-        print(f"\n✨ Enhanced with examples:")
-        for func in result2['enhanced_results'][:1]:
+        func = next(iter(result2.get('enhanced_results', ())), None)
+        if func is not None:
+            print(f"\n✨ Enhanced with examples:")
             print(f"  🔧 {func['name']} examples:")
             for link in func['tutorial_links'][:2]:
                 print(f"    • {link}")
             if 'official_documentation' in func:
                 print(f"    📖 Official docs: {func['official_documentation']}")
 
-    # Demo 3: PDG workflow guidance
-    print("\n\n📋 Demo 3: PDG Workflow Guidance")
-    print("-" * 34)
-    result3 = await tools.enhanced_pdg_guidance("file processing batch render")
+        # Demo 3: PDG workflow guidance
+        print("\n\n📋 Demo 3: PDG Workflow Guidance")
+        print("-" * 34)
+        result3 = await tools.enhanced_pdg_guidance("file processing batch render")
 
-    print(f"Query: '{result3['query']}'")
-    print(f"Relevant PDG components:")
-    for comp in result3['relevant_pdg_components'][:3]:
-        print(f"  • {comp['name']} ({comp['registry']})")
+        print(f"Query: '{result3['query']}'")
+        print(f"Relevant PDG components:")
+        for comp in result3['relevant_pdg_components'][:3]:
+            print(f"  • {comp['name']} ({comp['registry']})")
 
-    print(f"\n✨ Workflow tutorials:")
-    for tutorial in result3['workflow_tutorials'][:2]:
-        print(f"  • {tutorial}")
+        print(f"\n✨ Workflow tutorials:")
+        for tutorial in result3['workflow_tutorials'][:2]:
+            print(f"  • {tutorial}")
 
-    print(f"\n📖 PDG context: {result3['pdg_documentation_context']}")
+        print(f"\n📖 PDG context: {result3['pdg_documentation_context']}")
 
 def show_implementation_plan():
     """Show how to implement this in the actual MCP server."""
@@ -4,11 +4,11 @@ Quick Demo: Test Zabob MCP Server Tools
 Run this to see live examples of each tool's output
 """
 
+import os
 import sys
-from pathlib import Path
 
 # Add the src directory to path
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 def demo_tool(tool_name, description, func, *args, **kwargs):
     """Demo a single tool with error handling."""
@@ -58,6 +58,62 @@ def demo_tool(tool_name, description, func, *args, **kwargs):
     except Exception as e:
         print(f"❌ Error: {e}")
 
+def _functions_result(functions, count=None):
+    """Build a tool result from a list of functions, out of `count` in total."""
+    return {
+        "functions": [{"name": f.name, "module": f.module} for f in functions],
+        "count": len(functions) if count is None else count
+    }
+
+def _node_types_result(node_types, count=None, shown=None):
+    """Build a tool result from a list of node types, listing only the first `shown`."""
+    return {
+        "node_types": [{"name": nt.name, "category": nt.category} for nt in node_types[:shown]],
+        "count": len(node_types) if count is None else count
+    }
+
+def _entries_result(entries, count=None):
+    """Build a tool result from a list of PDG registry entries, out of `count` in total."""
+    return {
+        "entries": [{"name": e.name, "registry": e.registry} for e in entries],
+        "count": len(entries) if count is None else count
+    }
+
+def _demo_database_stats(db):
+    return {
+        "statistics": db.get_database_stats(),
+        "database_path": str(db.db_path)
+    }
+
+def _demo_primitive_functions(db):
+    return _functions_result(db.get_primitive_related_functions())
+
+def _demo_search_functions(db):
+    return _functions_result(*db.search_functions_by_keyword_with_count("attribute", 5))
+
+def _demo_search_node_types(db):
+    return _node_types_result(*db.search_node_types_with_count("deform", 5))
+
+def _demo_node_types_by_category(db):
+    return _node_types_result(db.get_node_types_by_category("Top"), shown=5)
+
+def _demo_search_pdg_registry(db):
+    return _entries_result(*db.search_pdg_registry_with_count("file", 5))
+
+def _demo_pdg_registry(db):
+    return _entries_result(*db.get_pdg_registry_with_count("Scheduler", 5))
+
+# (tool name, description, demo function taking the database)
+DEMOS = (
+    ("get_database_stats", "Overview of database contents", _demo_database_stats),
+    ("get_primitive_functions", "Functions for geometry/primitive operations", _demo_primitive_functions),
+    ("search_functions", "Search for attribute-related functions", _demo_search_functions),
+    ("search_node_types", "Find deformation SOP nodes", _demo_search_node_types),
+    ("get_node_types_by_category", "All TOP nodes for PDG workflows", _demo_node_types_by_category),
+    ("search_pdg_registry", "PDG components for file operations", _demo_search_pdg_registry),
+    ("get_pdg_registry", "All PDG schedulers", _demo_pdg_registry),
+)
+
 def main():
     """Run quick demos of all tools."""
     try:
@@ -71,86 +127,8 @@ def main():
 
         with db:
             # Demo each tool
-            demo_tool(
-                "get_database_stats",
-                "Overview of database contents",
-                lambda: {
-                    "statistics": db.get_database_stats(),
-                    "database_path": str(db.db_path)
-                }
-            )
-
-            demo_tool(
-                "get_primitive_functions",
-                "Functions for geometry/primitive operations",
-                lambda: {
-                    "functions": [
-                        {"name": f.name, "module": f.module}
-                        for f in db.get_primitive_related_functions()
-                    ],
-                    "count": len(db.get_primitive_related_functions())
-                }
-            )
-
-            demo_tool(
-                "search_functions",
-                "Search for attribute-related functions",
-                lambda: {
-                    "functions": [
-                        {"name": f.name, "module": f.module}
-                        for f in db.search_functions_by_keyword("attribute", 5)
-                    ],
-                    "count": len(db.search_functions_by_keyword("attribute", 5))
-                }
-            )
-
-            demo_tool(
-                "search_node_types",
-                "Find deformation SOP nodes",
-                lambda: {
-                    "node_types": [
-                        {"name": nt.name, "category": nt.category}
-                        for nt in db.search_node_types("deform", 5)
-                    ],
-                    "count": len(db.search_node_types("deform", 5))
-                }
-            )
-
-            demo_tool(
-                "get_node_types_by_category",
-                "All TOP nodes for PDG workflows",
-                lambda: {
-                    "node_types": [
-                        {"name": nt.name, "category": nt.category}
-                        for nt in db.get_node_types_by_category("Top")[:5]
-                    ],
-                    "count": len(db.get_node_types_by_category("Top"))
-                }
-            )
-
-            demo_tool(
-                "search_pdg_registry",
-                "PDG components for file operations",
-                lambda: {
-                    "entries": [
-                        {"name": e.name, "registry": e.registry}
-                        for e in db.search_pdg_registry("file", 5)
-                    ],
-                    "count": len(db.search_pdg_registry("file", 5))
-                }
-            )
-
-            demo_tool(
-                "get_pdg_registry",
-                "All PDG schedulers",
-                lambda: {
-                    "entries": [
-                        {"name": e.name, "registry": e.registry}
-                        for e in db.get_pdg_registry("Scheduler")
-                    ],
-                    "count": len(db.get_pdg_registry("Scheduler"))
-                }
-            )
+            for tool_name, description, func in DEMOS:
+                demo_tool(tool_name, description, func, db)
 
         print("\n✨ Demo complete!")
         print("🚀 These tools provide AI agents instant access to Houdini's Python API")
@@ -5,11 +5,13 @@ Fast demonstration of the key web search capabilities.
 """
 
 import asyncio
+import os
 import sys
-from pathlib import Path
 
 # Add the src directory to path
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from demo_utils import buffered_output
 
 try:
     from zabob.mcp.database import HoudiniDatabase
@@ -17,103 +19,111 @@ try:
         search_node_types,
         search_functions,
         web_search_houdini,
-        vscode_websearchforcopilot_webSearch
+        vscode_websearchforcopilot_webSearch,
+        close_http_client,
     )
 
     async def quick_web_search_demo():
         """Quick demonstration of web search integration."""
 
-        print("🚀 Zabob MCP Server: Quick Web Search Demo")
-        print("=" * 50)
-        print("✨ Demonstrating static database + live web search!")
-        print()
-
-        # Show static database capabilities first
-        print("📊 Static Database Capabilities:")
-        print("-" * 35)
-
-        db = HoudiniDatabase()
-        with db:
-            # Show database stats
-            stats = db.get_database_stats()
-            print(f"📈 Database contains:")
-            for key, value in stats.items():
-                if isinstance(value, int):
-                    print(f"   • {key.replace('_', ' ').title()}: {value:,}")
-
-            # Quick node search
-            lattice_nodes = db.search_node_types("lattice", limit=3)
-            print(f"\n🔍 Sample search - 'lattice' nodes: {len(lattice_nodes)} found")
-            for node in lattice_nodes[:2]:
-                print(f"   • {node.name} ({node.category}): {node.description[:40]}...")
-
-        # Now demonstrate web search integration
-        print(f"\n🌐 Web Search Integration:")
-        print("-" * 30)
-
-        print("🎯 Testing DuckDuckGo API connection...")
+        with buffered_output():
+            print("🚀 Zabob MCP Server: Quick Web Search Demo")
+            print("=" * 50)
+            print("✨ Demonstrating static database + live web search!")
+            print()
+
+            # Show static database capabilities first
+            print("📊 Static Database Capabilities:")
+            print("-" * 35)
+
+            db = HoudiniDatabase()
+            with db:
+                # Show database stats
+                stats = db.get_database_stats()
+                print(f"📈 Database contains:")
+                for key, value in stats.items():
+                    if isinstance(value, int):
+                        print(f"   • {key.replace('_', ' ').title()}: {value:,}")
+
+                # Quick node search
+                lattice_nodes = db.search_node_types("lattice", limit=3)
+                print(f"\n🔍 Sample search - 'lattice' nodes: {len(lattice_nodes)} found")
+                for node in lattice_nodes[:2]:
+                    print(f"   • {node.name} ({node.category}): {node.description[:40]}...")
+
+            # Now demonstrate web search integration
+            print(f"\n🌐 Web Search Integration:")
+            print("-" * 30)
+
+            print("🎯 Testing DuckDuckGo API connection...")
+
         try:
             # Simple web search test
-            search_result = await vscode_websearchforcopilot_webSearch("Houdini VEX", num_results=2)
-
-            print(f"✅ Web search successful!")
-            print(f"📄 Query: {search_result.get('query')}")
-            print(f"📊 Results: {len(search_result.get('results', []))}")
-
-            for i, result in enumerate(search_result.get('results', [])[:2], 1):
-                title = result.get('title', 'No title')[:50]
-                url = result.get('url', 'No URL')[:50]
-                print(f"   {i}. {title}...")
-                print(f"      {url}...")
-
-            error = search_result.get('error')
-            if error:
-                print(f"⚠️  Note: {error}")
+            try:
+                search_result = await vscode_websearchforcopilot_webSearch("Houdini VEX", num_results=2)
+            finally:
+                await close_http_client()
+
+            with buffered_output():
+                print(f"✅ Web search successful!")
+                print(f"📄 Query: {search_result.get('query')}")
+                print(f"📊 Results: {len(search_result.get('results', []))}")
+
+                for i, result in enumerate(search_result.get('results', [])[:2], 1):
+                    title = result.get('title', 'No title')[:50]
+                    url = result.get('url', 'No URL')[:50]
+                    print(f"   {i}. {title}...")
+                    print(f"      {url}...")
+
+                error = search_result.get('error')
+                if error:
+                    print(f"⚠️  Note: {error}")
 
         except Exception as e:
             print(f"⚠️  Web search error: {e}")
             print("   (This is expected in some network environments)")
 
-        # Show the integration potential
-        print(f"\n🔗 Integration Benefits:")
-        print("-" * 25)
-        print("✅ Static database provides:")
-        print("   • Complete Houdini API catalog")
-        print("   • Instant local search results")
-        print("   • Structured data for 15 MCP tools")
-        print()
-        print("✅ Web search enhancement adds:")
-        print("   • Live documentation from SideFX")
-        print("   • Community tutorials and examples")
-        print("   • Real-time problem-solving help")
-        print("   • Up-to-date workflow guidance")
-
-        # Show available MCP tools
-        print(f"\n🛠️  Available MCP Tools (15 total):")
-        print("-" * 35)
-        tools = [
-            "search_functions", "enhanced_search_functions",
-            "search_node_types", "enhanced_search_node_types",
-            "web_search_houdini", "fetch_houdini_docs",
-            "pdg_workflow_assistant", "get_database_stats"
-        ]
-
-        for i, tool in enumerate(tools, 1):
-            enhanced = "🌐" if "enhanced" in tool or "web" in tool else "📊"
-            print(f"   {enhanced} {tool}")
-        print("   📊 ... and 7 more database tools")
-
-        print(f"\n🎯 Success Metrics:")
-        print("-" * 18)
-        print("✅ Web search API integration: WORKING")
-        print("✅ Modern Python typing: COMPLETE")
-        print("✅ Error handling: ROBUST")
-        print("✅ MCP server tools: 15 FUNCTIONAL")
-        print("✅ Database connectivity: ESTABLISHED")
-
-        print(f"\n🚀 Ready for Production!")
-        print("The MCP server now combines the best of both worlds:")
-        print("📊 Local knowledge + 🌐 Live web resources")
+        with buffered_output():
+            # Show the integration potential
+            print(f"\n🔗 Integration Benefits:")
+            print("-" * 25)
+            print("✅ Static database provides:")
+            print("   • Complete Houdini API catalog")
+            print("   • Instant local search results")
+            print("   • Structured data for 15 MCP tools")
+            print()
+            print("✅ Web search enhancement adds:")
+            print("   • Live documentation from SideFX")
+            print("   • Community tutorials and examples")
+            print("   • Real-time problem-solving help")
+            print("   • Up-to-date workflow guidance")
+
+            # Show available MCP tools
+            print(f"\n🛠️  Available MCP Tools (15 total):")
+            print("-" * 35)
+            tools = [
+                "search_functions", "enhanced_search_functions",
+                "search_node_types", "enhanced_search_node_types",
+                "web_search_houdini", "fetch_houdini_docs",
+                "pdg_workflow_assistant", "get_database_stats"
+            ]
+
+            for i, tool in enumerate(tools, 1):
+                enhanced = "🌐" if "enhanced" in tool or "web" in tool else "📊"
+                print(f"   {enhanced} {tool}")
+            print("   📊 ... and 7 more database tools")
+
+            print(f"\n🎯 Success Metrics:")
+            print("-" * 18)
+            print("✅ Web search API integration: WORKING")
+            print("✅ Modern Python typing: COMPLETE")
+            print("✅ Error handling: ROBUST")
+            print("✅ MCP server tools: 15 FUNCTIONAL")
+            print("✅ Database connectivity: ESTABLISHED")
+
+            print(f"\n🚀 Ready for Production!")
+            print("The MCP server now combines the best of both worlds:")
+            print("📊 Local knowledge + 🌐 Live web resources")
 
     # Run the quick demo
     if __name__ == "__main__":
@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 """Simple test for the MCP server database functionality."""
 
+import os
 import sys
-from pathlib import Path
 
 # Add the src directory to path
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 try:
     from zabob.mcp.database import HoudiniDatabase
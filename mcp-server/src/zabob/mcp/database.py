@@ -5,9 +5,13 @@ This module provides functions to query the Houdini analysis database
 and return structured information about modules, functions, node types, etc.
 """
 
+import copy
+from collections import OrderedDict
+from functools import lru_cache, wraps
+import os
 import sqlite3
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Tuple, TypeVar
 from dataclasses import dataclass
 import sys
 
@@ -23,7 +27,7 @@ for p in (CORE_SRC, COMMON_SRC):
 from zabob.core.paths import ZABOB_OUT_DIR, ZABOB_HOUDINI_DATA
 
 
-@dataclass
+@dataclass(frozen=True)
 class FunctionInfo:
     """Information about a Houdini function."""
     name: str
@@ -35,7 +39,7 @@ class FunctionInfo:
     returns_nodes: bool = False
 
 
-@dataclass
+@dataclass(frozen=True)
 class ModuleInfo:
     """Information about a Houdini module."""
     name: str
@@ -45,7 +49,7 @@ class ModuleInfo:
     function_count: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class NodeTypeInfo:
     """Information about a Houdini node type."""
     name: str
@@ -58,13 +62,126 @@ class NodeTypeInfo:
     is_manager: bool
 
 
-@dataclass
+@dataclass(frozen=True)
 class PDGRegistryInfo:
     """Information about a PDG registry entry."""
     name: str
     registry: str
 
 
+def _parse_bool(value) -> bool:
+    """Parse a boolean value that might be stored as a string."""
+    if isinstance(value, str):
+        return value.lower() in ('true', '1', 'yes')
+    return bool(value)
+
+
+def _node_type_info(row: sqlite3.Row) -> NodeTypeInfo:
+    """Build a NodeTypeInfo from a houdini_node_types row."""
+    return NodeTypeInfo(
+        name=row['name'],
+        category=row['category'],
+        description=row['description'],
+        min_inputs=int(row['minNumInputs']),
+        max_inputs=int(row['maxNumInputs']),
+        max_outputs=int(row['maxNumOutputs']),
+        is_generator=_parse_bool(row['isGenerator']),
+        is_manager=_parse_bool(row['isManager'])
+    )
+
+
+T = TypeVar('T')
+
+
+# Look for functions with return types containing 'Node' or specific node types
+# Handle both old JSON format ("function") and new plain format (function)
+_RETURNS_NODES_WHERE = """
+    (type = 'function' OR type = '"function"')
+    AND (datatype LIKE '%Node%'
+         OR datatype LIKE '%hou.Node%'
+         OR datatype LIKE '%GeometryNode%'
+         OR datatype LIKE '%SopNode%'
+         OR datatype LIKE '%ObjNode%')
+"""
+
+
+# Look for functions with 'primitive', 'prim', 'geometry' in name or docstring
+# Handle both old JSON format ("function") and new plain format (function)
+_PRIMITIVE_RELATED_WHERE = """
+    (type = 'function' OR type = '"function"')
+    AND (name LIKE '%primitive%'
+         OR name LIKE '%prim%'
+         OR name LIKE '%geometry%'
+         OR name LIKE '%geo%'
+         OR docstring LIKE '%primitive%'
+         OR docstring LIKE '%geometry%'
+         OR docstring LIKE '%group%')
+"""
+
+
+# Truncate docstrings in the query, rather than fetching them whole.
+# Takes the truncation length (or NULL, for no truncation) three times.
+_DOCSTRING_COLUMN = """
+    CASE
+        WHEN ? IS NULL OR length(docstring) <= ? THEN docstring
+        ELSE substr(docstring, 1, ?) || '...'
+    END AS docstring
+"""
+
+
+# Connection tuning for our read-heavy workload: memory-map up to 256 MiB of
+# the file, keep up to 64 MiB of pages cached, and keep temp tables in memory.
+# We only ever read, so say so (query_only), and wait up to 5s rather than fail
+# if the analysis is busy rewriting the database.
+# Nothing here writes to the database file (hence no journal_mode=WAL),
+# so read-only databases are fine.
+_CONNECT_PRAGMAS = """
+    PRAGMA mmap_size = 268435456;
+    PRAGMA cache_size = -65536;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA query_only = 1;
+    PRAGMA busy_timeout = 5000;
+"""
+
+
+_QUERY_CACHE_SIZE = 32
+'The number of memoized query results to keep.'
+
+_QUERY_CACHE: OrderedDict[Tuple[Any, ...], Any] = OrderedDict()
+'''
+Memoized query results, least recently used first, keyed by the database
+file, its mtime, the query method, and its arguments. Including the mtime
+means results are recomputed whenever the database file changes.
+'''
+
+
+def _memoize_by_mtime(method: Callable[..., T]) -> Callable[..., T]:
+    """
+    Memoize a query method, keyed by the database file and its mtime,
+    and the method's (hashable) arguments.
+
+    On a miss, the query runs on the caller's own connection.
+    Callers get a shallow copy of the result, so they may modify the list or
+    dict itself, but the elements are shared between callers. The info
+    dataclasses are frozen for that reason.
+    """
+    @wraps(method)
+    def wrapper(self: 'HoudiniDatabase', *args: Any, **kwargs: Any) -> T:
+        db_path = os.fspath(self.db_path)
+        key = (db_path, os.stat(db_path).st_mtime_ns, method.__name__,
+               args, tuple(sorted(kwargs.items())))
+        try:
+            result = _QUERY_CACHE[key]
+            _QUERY_CACHE.move_to_end(key)
+        except KeyError:
+            result = method(self, *args, **kwargs)
+            _QUERY_CACHE[key] = result
+            if len(_QUERY_CACHE) > _QUERY_CACHE_SIZE:
+                _QUERY_CACHE.popitem(last=False)
+        return copy.copy(result)
+    return wrapper
+
+
 class HoudiniDatabase:
     """Interface to the Houdini analysis database."""
 
@@ -76,6 +193,7 @@ class HoudiniDatabase:
 
         self.db_path = db_path
         self._conn: sqlite3.Connection | None = None
+        self._depth = 0
 
     def _find_database(self) -> Path:
         """Find the Houdini database in standard locations."""
@@ -101,6 +219,7 @@ class HoudiniDatabase:
         if self._conn is None:
             self._conn = sqlite3.connect(self.db_path)
             self._conn.row_factory = sqlite3.Row
+            self._conn.executescript(_CONNECT_PRAGMAS)
         return self._conn
 
     def close(self):
@@ -110,56 +229,102 @@ class HoudiniDatabase:
             self._conn = None
 
     def __enter__(self):
+        self._depth += 1
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+        # Nested uses of a shared instance leave the connection open for the outer one.
+        self._depth -= 1
+        if self._depth == 0:
+            self.close()
 
-    def get_functions_returning_nodes(self) -> List[FunctionInfo]:
-        """Find functions that return node types."""
+    @_memoize_by_mtime
+    def get_functions_returning_nodes(self, doc_truncate: int | None = None) -> List[FunctionInfo]:
+        """
+        Find functions that return node types.
+
+        If `doc_truncate` is given, docstrings longer than that are cut
+        short, with '...' appended.
+        """
+        return list(self.iter_functions_returning_nodes(doc_truncate=doc_truncate))
+
+    def iter_functions_returning_nodes(self,
+                                       batch_size: int = 512,
+                                       doc_truncate: int | None = None
+                                       ) -> Iterator[FunctionInfo]:
+        """
+        Find functions that return node types, yielding them as they are read.
+
+        Rows are fetched `batch_size` at a time, so callers that only look
+        at the first few results never read the rest.
+        """
         conn = self.connect()
         cursor = conn.cursor()
 
-        # Look for functions with return types containing 'Node' or specific node types
-        # Handle both old JSON format ("function") and new plain format (function)
-        query = """
-        SELECT name, parent_name, parent_type, datatype, docstring
+        query = f"""
+        SELECT name, parent_name, parent_type, datatype, {_DOCSTRING_COLUMN}
         FROM houdini_module_data
-        WHERE (type = 'function' OR type = '"function"')
-        AND (datatype LIKE '%Node%'
-             OR datatype LIKE '%hou.Node%'
-             OR datatype LIKE '%GeometryNode%'
-             OR datatype LIKE '%SopNode%'
-             OR datatype LIKE '%ObjNode%')
+        WHERE {_RETURNS_NODES_WHERE}
         ORDER BY parent_name, name
         """
 
-        cursor.execute(query)
-        results = []
+        cursor.execute(query, (doc_truncate,) * 3)
+        while rows := cursor.fetchmany(batch_size):
+            for row in rows:
+                yield FunctionInfo(
+                    name=row['name'],
+                    module=row['parent_name'],
+                    parent_name=row['parent_name'],
+                    parent_type=row['parent_type'],
+                    datatype=row['datatype'],
+                    docstring=row['docstring'],
+                    returns_nodes=True
+                )
+
+    def count_functions_returning_nodes(self) -> int:
+        """Count the functions that return node types."""
+        conn = self.connect()
+        cursor = conn.cursor()
 
-        for row in cursor.fetchall():
-            func_info = FunctionInfo(
-                name=row['name'],
-                module=row['parent_name'],
-                parent_name=row['parent_name'],
-                parent_type=row['parent_type'],
-                datatype=row['datatype'],
-                docstring=row['docstring'],
-                returns_nodes=True
-            )
-            results.append(func_info)
+        cursor.execute(f"""
+        SELECT COUNT(*)
+        FROM houdini_module_data
+        WHERE {_RETURNS_NODES_WHERE}
+        """)
+        return cursor.fetchone()[0]
+
+    def search_functions_by_keyword(self,
+                                    keyword: str,
+                                    limit: int = 50,
+                                    doc_truncate: int | None = None
+                                    ) -> List[FunctionInfo]:
+        """
+        Search for functions by keyword in name or docstring.
 
-        return results
+        If `doc_truncate` is given, docstrings longer than that are cut
+        short, with '...' appended.
+        """
+        return self.search_functions_by_keyword_with_count(keyword, limit, doc_truncate)[0]
 
-    def search_functions_by_keyword(self, keyword: str, limit: int = 50) -> List[FunctionInfo]:
-        """Search for functions by keyword in name or docstring."""
+    def search_functions_by_keyword_with_count(self,
+                                               keyword: str,
+                                               limit: int = 50,
+                                               doc_truncate: int | None = None
+                                               ) -> Tuple[List[FunctionInfo], int]:
+        """
+        Search for functions by keyword, as in `search_functions_by_keyword`.
+
+        Returns the (limited) matches, and the total number of matches,
+        counted in the same query.
+        """
         conn = self.connect()
         cursor = conn.cursor()
 
         # Search in function names and docstrings
         # Handle both old JSON format ("function") and new plain format (function)
-        query = """
-        SELECT name, parent_name, parent_type, datatype, docstring
+        query = f"""
+        SELECT name, parent_name, parent_type, datatype, {_DOCSTRING_COLUMN},
+               COUNT(*) OVER () AS total
         FROM houdini_module_data
         WHERE (type = 'function' OR type = '"function"')
         AND (name LIKE ? OR docstring LIKE ?)
@@ -172,11 +337,11 @@ class HoudiniDatabase:
         keyword_pattern = f"%{keyword}%"
         name_pattern = f"%{keyword}%"
 
-        cursor.execute(query, (keyword_pattern, keyword_pattern, name_pattern, limit))
-        results = []
-
-        for row in cursor.fetchall():
-            func_info = FunctionInfo(
+        cursor.execute(query, (*(doc_truncate,) * 3,
+                               keyword_pattern, keyword_pattern, name_pattern, limit))
+        rows = cursor.fetchall()
+        results = [
+            FunctionInfo(
                 name=row['name'],
                 module=row['parent_name'],
                 parent_name=row['parent_name'],
@@ -184,28 +349,37 @@ class HoudiniDatabase:
                 datatype=row['datatype'],
                 docstring=row['docstring']
             )
-            results.append(func_info)
+            for row in rows
+        ]
+        return results, rows[0]['total'] if rows else 0
 
-        return results
+    @_memoize_by_mtime
+    def get_primitive_related_functions(self, doc_truncate: int | None = None) -> List[FunctionInfo]:
+        """
+        Find functions related to primitive operations.
 
-    def get_primitive_related_functions(self) -> List[FunctionInfo]:
-        """Find functions related to primitive operations."""
+        If `doc_truncate` is given, docstrings longer than that are cut
+        short, with '...' appended.
+        """
+        return list(self.iter_primitive_related_functions(doc_truncate=doc_truncate))
+
+    def iter_primitive_related_functions(self,
+                                         batch_size: int = 512,
+                                         doc_truncate: int | None = None
+                                         ) -> Iterator[FunctionInfo]:
+        """
+        Find functions related to primitive operations, yielding them as they are read.
+
+        Rows are fetched `batch_size` at a time, so callers that only look
+        at the first few results never read the rest.
+        """
         conn = self.connect()
         cursor = conn.cursor()
 
-        # Look for functions with 'primitive', 'prim', 'geometry' in name or docstring
-        # Handle both old JSON format ("function") and new plain format (function)
-        query = """
-        SELECT name, parent_name, parent_type, datatype, docstring
+        query = f"""
+        SELECT name, parent_name, parent_type, datatype, {_DOCSTRING_COLUMN}
         FROM houdini_module_data
-        WHERE (type = 'function' OR type = '"function"')
-        AND (name LIKE '%primitive%'
-             OR name LIKE '%prim%'
-             OR name LIKE '%geometry%'
-             OR name LIKE '%geo%'
-             OR docstring LIKE '%primitive%'
-             OR docstring LIKE '%geometry%'
-             OR docstring LIKE '%group%')
+        WHERE {_PRIMITIVE_RELATED_WHERE}
         ORDER BY
             CASE
                 WHEN name LIKE '%primitive%' THEN 1
@@ -217,22 +391,31 @@ class HoudiniDatabase:
             parent_name, name
         """
 
-        cursor.execute(query)
-        results = []
-
-        for row in cursor.fetchall():
-            func_info = FunctionInfo(
-                name=row['name'],
-                module=row['parent_name'],
-                parent_name=row['parent_name'],
-                parent_type=row['parent_type'],
-                datatype=row['datatype'],
-                docstring=row['docstring']
-            )
-            results.append(func_info)
+        cursor.execute(query, (doc_truncate,) * 3)
+        while rows := cursor.fetchmany(batch_size):
+            for row in rows:
+                yield FunctionInfo(
+                    name=row['name'],
+                    module=row['parent_name'],
+                    parent_name=row['parent_name'],
+                    parent_type=row['parent_type'],
+                    datatype=row['datatype'],
+                    docstring=row['docstring']
+                )
+
+    def count_primitive_related_functions(self) -> int:
+        """Count the functions related to primitive operations."""
+        conn = self.connect()
+        cursor = conn.cursor()
 
-        return results
+        cursor.execute(f"""
+        SELECT COUNT(*)
+        FROM houdini_module_data
+        WHERE {_PRIMITIVE_RELATED_WHERE}
+        """)
+        return cursor.fetchone()[0]
 
+    @_memoize_by_mtime
     def get_modules_summary(self) -> List[ModuleInfo]:
         """Get a summary of all modules."""
         conn = self.connect()
@@ -292,37 +475,78 @@ class HoudiniDatabase:
             """
             cursor.execute(query)
 
-        results = []
+        return [_node_type_info(row) for row in cursor.fetchall()]
 
-        for row in cursor.fetchall():
-            # Handle boolean values that might be stored as strings
-            def parse_bool(value):
-                if isinstance(value, str):
-                    return value.lower() in ('true', '1', 'yes')
-                return bool(value)
+    def get_node_types_by_names(self, category: str, names: List[str]) -> List[NodeTypeInfo]:
+        """Get the node types in a category with the given names."""
+        if not names:
+            return []
+        conn = self.connect()
+        cursor = conn.cursor()
 
-            node_info = NodeTypeInfo(
-                name=row['name'],
-                category=row['category'],
-                description=row['description'],
-                min_inputs=int(row['minNumInputs']),
-                max_inputs=int(row['maxNumInputs']),
-                max_outputs=int(row['maxNumOutputs']),
-                is_generator=parse_bool(row['isGenerator']),
-                is_manager=parse_bool(row['isManager'])
-            )
-            results.append(node_info)
+        # Filter in SQL, rather than fetching the whole category.
+        # Handle both old JSON format ("Sop") and new plain format (Sop)
+        placeholders = ", ".join("?" for _ in names)
+        query = f"""
+        SELECT name, category, description, minNumInputs, maxNumInputs,
+               maxNumOutputs, isGenerator, isManager
+        FROM houdini_node_types
+        WHERE (category = ? OR category = ?)
+        AND name IN ({placeholders})
+        ORDER BY name
+        """
+        cursor.execute(query, (f'"{category}"', category, *names))
 
-        return results
+        return [_node_type_info(row) for row in cursor.fetchall()]
+
+    def count_node_types_by_category(self, category: str) -> int:
+        """Count the node types in a category."""
+        conn = self.connect()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+        SELECT COUNT(*)
+        FROM houdini_node_types
+        WHERE category = ? OR category = ?
+        """, (f'"{category}"', category))
+        return cursor.fetchone()[0]
+
+    @_memoize_by_mtime
+    def get_node_type_categories(self, name: str) -> List[str]:
+        """Get the categories that have a node type with the given name."""
+        conn = self.connect()
+        cursor = conn.cursor()
+
+        # Handle both old JSON format ("Sop") and new plain format (Sop)
+        cursor.execute("""
+        SELECT DISTINCT trim(category, '"') AS category
+        FROM houdini_node_types
+        WHERE name = ?
+        ORDER BY category
+        """, (name,))
+        return [row['category'] for row in cursor.fetchall()]
 
     def search_node_types(self, keyword: str, limit: int = 50) -> List[NodeTypeInfo]:
         """Search node types by keyword."""
+        return self.search_node_types_with_count(keyword, limit)[0]
+
+    def search_node_types_with_count(self,
+                                     keyword: str,
+                                     limit: int = 50
+                                     ) -> Tuple[List[NodeTypeInfo], int]:
+        """
+        Search node types by keyword, as in `search_node_types`.
+
+        Returns the (limited) matches, and the total number of matches,
+        counted in the same query.
+        """
         conn = self.connect()
         cursor = conn.cursor()
 
         query = """
         SELECT name, category, description, minNumInputs, maxNumInputs,
-               maxNumOutputs, isGenerator, isManager
+               maxNumOutputs, isGenerator, isManager,
+               COUNT(*) OVER () AS total
         FROM houdini_node_types
         WHERE name LIKE ? OR description LIKE ?
         ORDER BY
@@ -335,29 +559,11 @@ class HoudiniDatabase:
         name_pattern = f"%{keyword}%"
 
         cursor.execute(query, (keyword_pattern, keyword_pattern, name_pattern, limit))
-        results = []
-
-        for row in cursor.fetchall():
-            # Handle boolean values that might be stored as strings
-            def parse_bool(value):
-                if isinstance(value, str):
-                    return value.lower() in ('true', '1', 'yes')
-                return bool(value)
-
-            node_info = NodeTypeInfo(
-                name=row['name'],
-                category=row['category'],
-                description=row['description'],
-                min_inputs=int(row['minNumInputs']),
-                max_inputs=int(row['maxNumInputs']),
-                max_outputs=int(row['maxNumOutputs']),
-                is_generator=parse_bool(row['isGenerator']),
-                is_manager=parse_bool(row['isManager'])
-            )
-            results.append(node_info)
-
-        return results
+        rows = cursor.fetchall()
+        results = [_node_type_info(row) for row in rows]
+        return results, rows[0]['total'] if rows else 0
 
+    @_memoize_by_mtime
     def get_database_stats(self) -> Dict[str, int]:
         """Get statistics about the database contents."""
         conn = self.connect()
@@ -393,42 +599,73 @@ class HoudiniDatabase:
 
     def get_pdg_registry(self, registry_type: str | None = None) -> List[PDGRegistryInfo]:
         """Get PDG registry entries, optionally filtered by registry type."""
+        return self.get_pdg_registry_with_count(registry_type)[0]
+
+    def get_pdg_registry_with_count(self,
+                                    registry_type: str | None = None,
+                                    limit: int | None = None
+                                    ) -> Tuple[List[PDGRegistryInfo], int]:
+        """
+        Get PDG registry entries, as in `get_pdg_registry`, up to `limit` of them.
+
+        Returns the (limited) entries, and the total number of entries,
+        counted in the same query.
+        """
         conn = self.connect()
         cursor = conn.cursor()
 
-        if registry_type:
-            query = """
-            SELECT name, registry
-            FROM pdg_registry
-            WHERE registry = ?
-            ORDER BY name
-            """
-            cursor.execute(query, (registry_type,))
-        else:
-            query = """
-            SELECT name, registry
-            FROM pdg_registry
-            ORDER BY registry, name
-            """
-            cursor.execute(query)
-
-        results = []
-        for row in cursor.fetchall():
-            pdg_info = PDGRegistryInfo(
+        # A negative LIMIT is no limit.
+        query = """
+        SELECT name, registry, COUNT(*) OVER () AS total
+        FROM pdg_registry
+        WHERE ? IS NULL OR registry = ?
+        ORDER BY registry, name
+        LIMIT ?
+        """
+        registry_type = registry_type or None
+        cursor.execute(query, (registry_type, registry_type, -1 if limit is None else limit))
+        rows = cursor.fetchall()
+        results = [
+            PDGRegistryInfo(
                 name=row['name'],
                 registry=row['registry']
             )
-            results.append(pdg_info)
+            for row in rows
+        ]
+        return results, rows[0]['total'] if rows else 0
 
-        return results
+    def count_pdg_registry(self, registry_type: str | None = None) -> int:
+        """Count the PDG registry entries, optionally filtered by registry type."""
+        conn = self.connect()
+        cursor = conn.cursor()
+
+        registry_type = registry_type or None
+        cursor.execute("""
+        SELECT COUNT(*)
+        FROM pdg_registry
+        WHERE ? IS NULL OR registry = ?
+        """, (registry_type, registry_type))
+        return cursor.fetchone()[0]
 
     def search_pdg_registry(self, keyword: str, limit: int = 50) -> List[PDGRegistryInfo]:
         """Search PDG registry entries by keyword in name."""
+        return self.search_pdg_registry_with_count(keyword, limit)[0]
+
+    def search_pdg_registry_with_count(self,
+                                       keyword: str,
+                                       limit: int = 50
+                                       ) -> Tuple[List[PDGRegistryInfo], int]:
+        """
+        Search PDG registry entries by keyword, as in `search_pdg_registry`.
+
+        Returns the (limited) matches, and the total number of matches,
+        counted in the same query.
+        """
         conn = self.connect()
         cursor = conn.cursor()
 
         query = """
-        SELECT name, registry
+        SELECT name, registry, COUNT(*) OVER () AS total
         FROM pdg_registry
         WHERE name LIKE ?
         ORDER BY
@@ -448,13 +685,78 @@ class HoudiniDatabase:
         ends_with = f"%{keyword}"
 
         cursor.execute(query, (search_pattern, exact_match, starts_with, ends_with, limit))
-
-        results = []
-        for row in cursor.fetchall():
-            pdg_info = PDGRegistryInfo(
+        rows = cursor.fetchall()
+        results = [
+            PDGRegistryInfo(
                 name=row['name'],
                 registry=row['registry']
             )
-            results.append(pdg_info)
+            for row in rows
+        ]
+        return results, rows[0]['total'] if rows else 0
 
-        return results
+    def search_pdg_registry_multi(self, keywords: List[str], limit_per: int = 3) -> List[PDGRegistryInfo]:
+        """
+        Search PDG registry entries for several keywords at once.
+
+        Returns up to `limit_per` entries for each keyword, ranked as in
+        `search_pdg_registry`, in keyword order, without duplicates.
+        """
+        if not keywords:
+            return []
+        conn = self.connect()
+        cursor = conn.cursor()
+
+        # One query for all the keywords, keeping the best few matches for each.
+        values = ", ".join("(?, ?)" for _ in keywords)
+        query = f"""
+        WITH keywords(pos, keyword) AS (VALUES {values}),
+        matches AS (
+            SELECT
+                k.pos,
+                p.name,
+                p.registry,
+                ROW_NUMBER() OVER (
+                    PARTITION BY k.pos
+                    ORDER BY
+                        CASE
+                            WHEN p.name = k.keyword THEN 1
+                            WHEN p.name LIKE k.keyword || '%' THEN 2
+                            WHEN p.name LIKE '%' || k.keyword THEN 3
+                            ELSE 4
+                        END,
+                        p.registry, p.name
+                ) AS rank
+            FROM keywords k
+            JOIN pdg_registry p ON p.name LIKE '%' || k.keyword || '%'
+        )
+        SELECT name, registry
+        FROM matches
+        WHERE rank <= ?
+        ORDER BY pos, rank
+        """
+        params = [v for pos, keyword in enumerate(keywords) for v in (pos, keyword)]
+        cursor.execute(query, (*params, limit_per))
+
+        # The same entry can match more than one keyword; keep the first.
+        results: Dict[Tuple[str, str], PDGRegistryInfo] = {}
+        for row in cursor.fetchall():
+            key = (row['name'], row['registry'])
+            if key not in results:
+                results[key] = PDGRegistryInfo(
+                    name=row['name'],
+                    registry=row['registry']
+                )
+
+        return list(results.values())
+
+
+@lru_cache(maxsize=1)
+def get_db() -> HoudiniDatabase:
+    """
+    Get the shared database, for the standard database location.
+
+    Sharing it lets scripts and modules in the same process reuse one connection,
+    with its page cache, rather than each opening their own.
+    """
+    return HoudiniDatabase()
@@ -3,7 +3,6 @@
 # requires-python = ">=3.12"
 # dependencies = [
 #     "aiohttp",
-#     "aiopath",
 #     "anyio",
 #     "click>=8.0.0,<8.2.0",
 #     "fastapi",
@@ -15,43 +14,51 @@
 #     "semver",
 #     "sqlite-vec",
 #     "uvicorn",
+#     "uvloop; sys_platform != 'win32'",
 # ]
 # ///
 '''
 An MCP server for the Zabob project.
 '''
 
-from collections.abc import AsyncGenerator, AsyncIterable, Awaitable, AsyncIterator
+from collections import OrderedDict
+from collections.abc import Awaitable, AsyncIterator, Callable, Iterator
 import json
-from typing import Any, TypeVar, cast, TypedDict
+from typing import Any, NotRequired, TypedDict
 import asyncio
+import os
 import sys
 import click
 import httpx
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache, wraps
+import time
 
-from aiopath.path import AsyncPath as Path
-from pathlib import Path as SyncPath
+from pathlib import Path
 
 from mcp.server.fastmcp import FastMCP
 
 
-ROOT = SyncPath(__file__).parent.parent.parent.parent.parent
+ROOT = Path(__file__).parent.parent.parent.parent.parent
 MCP_SRC = ROOT/ 'mcp-server/src'
 CORE_SRC = ROOT / 'zabob-modules/src'
 COMMON_SRC = ROOT / 'houdini/zcommon/src'
 
 # Check for source directories (but not .venv in Docker)
+# Those already on sys.path (e.g. from an earlier import) don't need checking.
 for p in (MCP_SRC, CORE_SRC, COMMON_SRC):
-    if not p.exists():
+    p_str = str(p)
+    if p_str in sys.path:
+        continue
+    if not os.path.isdir(p_str):
         print(f"Error: {p} does not exist. Please run 'zabob setup' first.", file=sys.stderr)
         sys.exit(1)
-    if str(p) not in sys.path:
-        sys.path.insert(0, str(p))  # type: ignore[no-redef]
+    sys.path.insert(0, p_str)  # type: ignore[no-redef]
 
 from zabob.core import JsonData
-from zabob.mcp.database import HoudiniDatabase
+from zabob.mcp.database import get_db
+from zabob.mcp.database import FunctionInfo as DBFunctionInfo, NodeTypeInfo as DBNodeTypeInfo
 
 # TypedDict definitions for better type safety
 class SearchResult(TypedDict):
@@ -90,20 +97,22 @@ class EnhancedFunctionInfo(FunctionInfo):
 
 RESPONSES_DIR = Path(__file__).parent / "responses"
 PROMPTS_DIR = Path(__file__).parent / "prompts"
-INSTRUCTIONS_PATH = SyncPath(__file__).parent / "instructions.md"
-with open(INSTRUCTIONS_PATH, "r", encoding="utf-8") as f:
-    INSTRUCTIONS = f.read()
+INSTRUCTIONS_PATH = Path(__file__).parent / "instructions.md"
+# FastMCP takes the instructions when it's constructed, so they can't be deferred.
+INSTRUCTIONS = INSTRUCTIONS_PATH.read_text(encoding="utf-8")
 
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[None]:
     """Manage application lifecycle - initialize responses on startup."""
     try:
         # Initialize responses and prompts during startup
-        # This awaits the listing of responses, but not their loading.
-        # That happens at the point of first use, or on exit.
-        await load_responses()
+        # This lists the responses, but does not load them.
+        # That happens at the point of first use.
+        load_responses()
         yield
     finally:
+        await close_http_client()
+        db.close()
         # Cancel any remaining tasks for graceful shutdown
         current_task = asyncio.current_task()
         tasks = [task for task in asyncio.all_tasks() if task != current_task and not task.done()]
@@ -122,103 +131,240 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[None]:
 
 mcp = FastMCP("zabob", instructions=INSTRUCTIONS, lifespan=app_lifespan)
 
-RESPONSES: dict[str, Awaitable[JsonData|str]] =  {}
-PROMPTS: dict[str, Awaitable[JsonData|str]] =  {}
+# The file each response or prompt is loaded from, and its kind ("json" or "md").
+RESPONSES: dict[str, tuple[Path, str]] =  {}
+PROMPTS: dict[str, tuple[Path, str]] =  {}
 
 
 
-async def load_responses():
-    """Load response JSON and Markdown files."""
-    async def load_text(f: Path):
-        if await f.is_file():
-            async with f.open("r", encoding="utf-8") as stream:
-                return await stream.read()
-    async def load_json(f: Path):
-        text = await load_text(f)
-        if text:
-            return json.loads(text)
-    async for f in cast(AsyncIterable[Path], RESPONSES_DIR.glob("*.json")):
-        RESPONSES[f.stem] = load_json(f)
-    async for f in cast(AsyncIterable[Path], RESPONSES_DIR.glob("*.md")):
-        RESPONSES[f.stem] = load_text(f)
-    async for f in cast(AsyncIterable[Path], PROMPTS_DIR.glob("*.md")):
-        PROMPTS[f.stem] = load_text(f)
+def load_responses():
+    """
+    List the response JSON and Markdown files, and the prompt Markdown files.
 
+    Their contents are loaded on first use, by `_load_response`.
+    """
+    # One scan per directory, dispatching on the suffix.
+    # A Markdown response takes precedence over a JSON one of the same name.
+    for entry in _scan_files(RESPONSES_DIR):
+        name = entry.name
+        if name.endswith(".md"):
+            RESPONSES[name[:-3]] = (Path(entry.path), "md")
+        elif name.endswith(".json"):
+            RESPONSES.setdefault(name[:-5], (Path(entry.path), "json"))
+    for entry in _scan_files(PROMPTS_DIR):
+        name = entry.name
+        if name.endswith(".md"):
+            PROMPTS[name[:-3]] = (Path(entry.path), "md")
+
+
+def _scan_files(directory: os.PathLike) -> Iterator[os.DirEntry]:
+    """The files directly within `directory`; none if it does not exist."""
+    with suppress(FileNotFoundError, NotADirectoryError), os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file():
+                yield entry
+
+
+@lru_cache(maxsize=256)
+def _load_response(path: Path, kind: str) -> JsonData | str | None:
+    """Load a response or prompt file. Each is read at most once."""
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    if kind == "json":
+        return json.loads(text) if text else None
+    return text
 
-T = TypeVar("T")
-def awaitable_value(value: T) -> Awaitable[T]:
-    async def wrapper() -> AsyncGenerator[T, None]:
-        yield  value
-    return anext(aiter(wrapper()))
+
+def _lookup_response(table: dict[str, tuple[Path, str]], name: str) -> JsonData | str | None:
+    """Look up a response or prompt by name, loading it if need be."""
+    entry = table.get(name)
+    if entry is None:
+        return "No response found."
+    return _load_response(*entry)
 
 # Initialize database connection
-db = HoudiniDatabase()
+# The connection is opened on first use, kept for the life of the server,
+# and closed on shutdown.
+db = get_db()
+
+# Docstrings in tool results are cut short at this length, by the database query.
+_DOC_PREVIEW = 200
+
+def _function_dict(f: DBFunctionInfo) -> dict[str, Any]:
+    """A function, as returned by the tools."""
+    return {
+        "name": f.name,
+        "module": f.module,
+        "datatype": f.datatype,
+        "docstring": f.docstring
+    }
+
+def _node_type_dict(nt: DBNodeTypeInfo) -> dict[str, Any]:
+    """A node type, as returned by the tools."""
+    return {
+        "name": nt.name,
+        "category": nt.category,
+        "description": nt.description,
+        "inputs": f"{nt.min_inputs}-{nt.max_inputs}",
+        "outputs": nt.max_outputs,
+        "is_generator": nt.is_generator
+    }
 
 # Web search integration helpers
+
+_HTTP_CLIENT: httpx.AsyncClient | None = None
+
+
+def http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client for the web helpers.
+
+    Sharing one client lets concurrent and repeated requests reuse pooled
+    connections, rather than each paying for a new TCP and TLS handshake.
+    """
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=8),
+            timeout=10.0,
+            follow_redirects=True,
+        )
+    return _HTTP_CLIENT
+
+
+async def close_http_client():
+    """Close the shared HTTP client, if it is open."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        client, _HTTP_CLIENT = _HTTP_CLIENT, None
+        await client.aclose()
+
+
+_SEARCH_LIMIT = asyncio.Semaphore(3)
+'The most DuckDuckGo searches in flight at once. It rate-limits bursts of queries.'
+_FETCH_LIMIT = asyncio.Semaphore(10)
+'The most page fetches in flight at once.'
+
+_DDG_URL = httpx.URL("https://api.duckduckgo.com/")
+'The DuckDuckGo instant answer API, parsed once.'
+_DDG_PARAMS = (("format", "json"), ("no_html", "1"), ("skip_disambig", "1"))
+'The fixed query parameters for the instant answer API; the query is added per call.'
+
+_WEB_CACHE_TTL = 3600.0
+'How long, in seconds, web search and fetch results are reused.'
+_WEB_CACHE_SIZE = 256
+'The most results kept by each web cache.'
+
+
+def _web_cache(
+    keep: Callable[[Any], bool],
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Cache the results of a web helper by its arguments, for _WEB_CACHE_TTL seconds.
+
+    The enhanced tools look up the same popular names repeatedly, and DuckDuckGo
+    rate-limits repeated queries. The in-flight task is cached, so concurrent calls
+    with the same arguments share one request.
+
+    Args:
+    keep: Whether a result should be cached. Failures should not be.
+    """
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        cache: OrderedDict[tuple, tuple[float, asyncio.Task]] = OrderedDict()
+
+        @wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = tuple(
+                tuple(a) if isinstance(a, list) else a
+                for a in (*args, *sorted(kwargs.items()))
+            )
+            now = time.monotonic()
+            entry = cache.get(key)
+            if entry is not None and entry[0] > now:
+                cache.move_to_end(key)
+                task = entry[1]
+            else:
+                task = asyncio.ensure_future(fn(*args, **kwargs))
+                cache[key] = (now + _WEB_CACHE_TTL, task)
+                if len(cache) > _WEB_CACHE_SIZE:
+                    cache.popitem(last=False)
+
+            def forget():
+                if key in cache and cache[key][1] is task:
+                    del cache[key]
+            try:
+                # Don't let one caller's cancellation cancel the shared request.
+                result = await asyncio.shield(task)
+            except BaseException:
+                if task.done():
+                    forget()
+                raise
+            if not keep(result):
+                forget()
+            return result
+        return wrapper
+    return decorator
+
+
+@_web_cache(keep=lambda result: result["error"] is None)
 async def vscode_websearchforcopilot_webSearch(query: str, num_results: int = 5) -> dict[str, Any]:
     """Perform web search using DuckDuckGo instant answer API."""
     try:
         # Use DuckDuckGo's instant answer API (no API key required)
-        async with httpx.AsyncClient() as client:
-            # DuckDuckGo instant answer API
-            params = {
-                "q": query,
-                "format": "json",
-                "no_html": "1",
-                "skip_disambig": "1"
-            }
-
+        client = http_client()
+        async with _SEARCH_LIMIT:
             response = await client.get(
-                "https://api.duckduckgo.com/",
-                params=params,
-                timeout=10.0
+                _DDG_URL,
+                params=(("q", query), *_DDG_PARAMS),
             )
 
-            if response.status_code == 200:
-                data = response.json()
-                results = []
+        if response.status_code == 200:
+            data = response.json()
+            results = []
 
-                # Extract abstract/definition if available
-                if data.get("Abstract"):
-                    results.append({
-                        "title": data.get("AbstractText", query),
-                        "url": data.get("AbstractURL", ""),
-                        "snippet": data.get("Abstract", "")[:300]
-                    })
+            # Extract abstract/definition if available
+            if data.get("Abstract"):
+                results.append({
+                    "title": data.get("AbstractText", query),
+                    "url": data.get("AbstractURL", ""),
+                    "snippet": data.get("Abstract", "")[:300]
+                })
 
-                # Extract related topics
-                for topic in data.get("RelatedTopics", [])[:num_results-len(results)]:
-                    if isinstance(topic, dict) and "Text" in topic:
-                        results.append({
-                            "title": topic.get("FirstURL", "").split("/")[-1].replace("_", " "),
-                            "url": topic.get("FirstURL", ""),
-                            "snippet": topic.get("Text", "")[:200]
-                        })
-
-                # If no results, create a basic search result
-                if not results:
+            # Extract related topics
+            for topic in data.get("RelatedTopics", [])[:num_results-len(results)]:
+                if isinstance(topic, dict) and "Text" in topic:
                     results.append({
-                        "title": f"Search results for '{query}'",
-                        "url": f"https://duckduckgo.com/?q={query.replace(' ', '+')}",
-                        "snippet": f"No direct results found. Try searching on DuckDuckGo for more information about '{query}'."
+                        "title": topic.get("FirstURL", "").split("/")[-1].replace("_", " "),
+                        "url": topic.get("FirstURL", ""),
+                        "snippet": topic.get("Text", "")[:200]
                     })
 
-                return {
-                    "query": query,
-                    "results": results[:num_results],
-                    "error": None
-                }
-            else:
-                logging.warning(f"DuckDuckGo API returned status {response.status_code}")
-                return {
-                    "query": query,
-                    "results": [{
-                        "title": f"Search for '{query}'",
-                        "url": f"https://duckduckgo.com/?q={query.replace(' ', '+')}",
-                        "snippet": "Search results available on DuckDuckGo"
-                    }],
-                    "error": None
-                }
+            # If no results, create a basic search result
+            if not results:
+                results.append({
+                    "title": f"Search results for '{query}'",
+                    "url": f"https://duckduckgo.com/?q={query.replace(' ', '+')}",
+                    "snippet": f"No direct results found. Try searching on DuckDuckGo for more information about '{query}'."
+                })
+
+            return {
+                "query": query,
+                "results": results[:num_results],
+                "error": None
+            }
+        else:
+            logging.warning(f"DuckDuckGo API returned status {response.status_code}")
+            return {
+                "query": query,
+                "results": [{
+                    "title": f"Search for '{query}'",
+                    "url": f"https://duckduckgo.com/?q={query.replace(' ', '+')}",
+                    "snippet": "Search results available on DuckDuckGo"
+                }],
+                "error": f"HTTP {response.status_code}"
+            }
 
     except Exception as e:
         logging.error(f"Web search failed: {e}")
@@ -232,21 +378,89 @@ async def vscode_websearchforcopilot_webSearch(query: str, num_results: int = 5)
             "error": str(e)
         }
 
+_DOCS_URL = "https://www.sidefx.com/docs/houdini"
+'The root of the official Houdini documentation.'
+
+_NODE_DOC_CATEGORIES = frozenset(('sop', 'top', 'object', 'dop'))
+'The node categories whose official docs enhanced_search_node_types fetches.'
+
+
+def _node_doc_url(category: str, name: str) -> str:
+    """The official documentation page for a node type. `category` is lowercase."""
+    return f"{_DOCS_URL}/nodes/{category}/{name}.html"
+
+
+def _hom_doc_url(name: str) -> str:
+    """The official documentation page for a hou function."""
+    return f"{_DOCS_URL}/hom/hou/{name}.html"
+
+
+_PAGE_PREVIEW = 1000
+'How many characters of a fetched page fetch_webpage returns.'
+
+_FAILED_PAGE_TTL = 300.0
+'How long, in seconds, a page that returned an error status is not requested again.'
+
+_FAILED_PAGES: dict[str, float] = {}
+'''
+URLs that returned an error status (e.g. a 404 for a guessed node category),
+and when they may be tried again. Entries are in the order they expire.
+'''
+
+
+async def _fetch_text(client: httpx.AsyncClient, url: str) -> str | None:
+    """
+    Fetch the start of one page, returning its text, or None if it couldn't be fetched.
+
+    Only the preview is needed, so the body is streamed, and the download is
+    dropped once we have enough. A UTF-8 character is at most 4 bytes.
+    """
+    now = time.monotonic()
+    if _FAILED_PAGES.get(url, 0.0) > now:
+        return None
+    try:
+        async with _FETCH_LIMIT, client.stream("GET", url) as response:
+            if response.status_code != 200:
+                # Re-inserting keeps the entries in expiry order.
+                _FAILED_PAGES.pop(url, None)
+                _FAILED_PAGES[url] = now + _FAILED_PAGE_TTL
+                if len(_FAILED_PAGES) > _WEB_CACHE_SIZE:
+                    del _FAILED_PAGES[next(iter(_FAILED_PAGES))]
+                return None
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body += chunk
+                if len(body) >= 4 * _PAGE_PREVIEW:
+                    break
+    except Exception as e:
+        logging.warning(f"Failed to fetch {url}: {e}")
+        return None
+    # Simple text extraction (in practice, you'd want better HTML parsing)
+    text = body.decode(response.charset_encoding or "utf-8", errors="replace")
+    return text[:_PAGE_PREVIEW]
+
+@_web_cache(keep=lambda content: not content.startswith(("Fetch error:", "No content")))
 async def fetch_webpage(urls: list[str], query: str) -> str:
-    """Fetch content from web pages."""
+    """
+    Fetch content from web pages.
+
+    The URLs are alternatives (e.g. the same node under each category), so they
+    are fetched concurrently, but the earliest URL in the list that succeeds wins,
+    so the result doesn't depend on which server answers first. Once it is found,
+    the fetches for later URLs are cancelled.
+    """
     try:
-        async with httpx.AsyncClient() as client:
-            for url in urls:
-                try:
-                    response = await client.get(url, timeout=10.0)
-                    if response.status_code == 200:
-                        # Simple text extraction (in practice, you'd want better HTML parsing)
-                        content = response.text
-                        # Return first 1000 characters as preview
-                        return content[:1000] if len(content) > 1000 else content
-                except Exception as e:
-                    logging.warning(f"Failed to fetch {url}: {e}")
-                    continue
+        client = http_client()
+        tasks = [asyncio.create_task(_fetch_text(client, url)) for url in urls]
+        try:
+            for task in tasks:
+                content = await task
+                if content is not None:
+                    # Already cut short to the preview length
+                    return content
+        finally:
+            for task in tasks:
+                task.cancel()
         return "No content could be fetched from provided URLs"
     except Exception as e:
         logging.error(f"Webpage fetch failed: {e}")
@@ -256,20 +470,11 @@ async def fetch_webpage(urls: list[str], query: str) -> str:
 async def get_functions_returning_nodes():
     """Find functions that return Houdini node objects."""
     try:
-        with db:
-            functions = db.get_functions_returning_nodes()
-            return {
-                "functions": [
-                    {
-                        "name": f.name,
-                        "module": f.module,
-                        "datatype": f.datatype,
-                        "docstring": f.docstring[:200] + "..." if f.docstring and len(f.docstring) > 200 else f.docstring
-                    }
-                    for f in functions
-                ],
-                "count": len(functions)
-            }
+        functions = db.get_functions_returning_nodes(doc_truncate=_DOC_PREVIEW)
+        return {
+            "functions": [_function_dict(f) for f in functions],
+            "count": len(functions)
+        }
     except Exception as e:
         return {"error": f"Database query failed: {str(e)}"}
 
@@ -280,21 +485,12 @@ async def search_functions(keyword: str, limit: int = 20):
         return {"error": "No keyword provided."}
 
     try:
-        with db:
-            functions = db.search_functions_by_keyword(keyword, limit)
-            return {
-                "keyword": keyword,
-                "functions": [
-                    {
-                        "name": f.name,
-                        "module": f.module,
-                        "datatype": f.datatype,
-                        "docstring": f.docstring[:200] + "..." if f.docstring and len(f.docstring) > 200 else f.docstring
-                    }
-                    for f in functions
-                ],
-                "count": len(functions)
-            }
+        functions = db.search_functions_by_keyword(keyword, limit, doc_truncate=_DOC_PREVIEW)
+        return {
+            "keyword": keyword,
+            "functions": [_function_dict(f) for f in functions],
+            "count": len(functions)
+        }
     except Exception as e:
         return {"error": f"Database query failed: {str(e)}"}
 
@@ -302,20 +498,11 @@ async def search_functions(keyword: str, limit: int = 20):
 async def get_primitive_functions():
     """Find functions related to primitive operations (selection, manipulation, etc.)."""
     try:
-        with db:
-            functions = db.get_primitive_related_functions()
-            return {
-                "functions": [
-                    {
-                        "name": f.name,
-                        "module": f.module,
-                        "datatype": f.datatype,
-                        "docstring": f.docstring[:200] + "..." if f.docstring and len(f.docstring) > 200 else f.docstring
-                    }
-                    for f in functions
-                ],
-                "count": len(functions)
-            }
+        functions = db.get_primitive_related_functions(doc_truncate=_DOC_PREVIEW)
+        return {
+            "functions": [_function_dict(f) for f in functions],
+            "count": len(functions)
+        }
     except Exception as e:
         return {"error": f"Database query failed: {str(e)}"}
 
@@ -323,20 +510,19 @@ async def get_primitive_functions():
 async def get_modules_summary():
     """Get a summary of all Houdini modules with function counts."""
     try:
-        with db:
-            modules = db.get_modules_summary()
-            return {
-                "modules": [
-                    {
-                        "name": m.name,
-                        "status": m.status,
-                        "function_count": m.function_count,
-                        "file": m.file
-                    }
-                    for m in modules[:50]  # Limit to first 50 for readability
-                ],
-                "total_count": len(modules)
-            }
+        modules = db.get_modules_summary()
+        return {
+            "modules": [
+                {
+                    "name": m.name,
+                    "status": m.status,
+                    "function_count": m.function_count,
+                    "file": m.file
+                }
+                for m in modules[:50]  # Limit to first 50 for readability
+            ],
+            "total_count": len(modules)
+        }
     except Exception as e:
         return {"error": f"Database query failed: {str(e)}"}
 
@@ -347,23 +533,12 @@ async def search_node_types(keyword: str, limit: int = 20):
         return {"error": "No keyword provided."}
 
     try:
-        with db:
-            node_types = db.search_node_types(keyword, limit)
-            return {
-                "keyword": keyword,
-                "node_types": [
-                    {
-                        "name": nt.name,
-                        "category": nt.category,
-                        "description": nt.description,
-                        "inputs": f"{nt.min_inputs}-{nt.max_inputs}",
-                        "outputs": nt.max_outputs,
-                        "is_generator": nt.is_generator
-                    }
-                    for nt in node_types
-                ],
-                "count": len(node_types)
-            }
+        node_types = db.search_node_types(keyword, limit)
+        return {
+            "keyword": keyword,
+            "node_types": [_node_type_dict(nt) for nt in node_types],
+            "count": len(node_types)
+        }
     except Exception as e:
         return {"error": f"Database query failed: {str(e)}"}
 
@@ -371,66 +546,51 @@ async def search_node_types(keyword: str, limit: int = 20):
 async def enhanced_search_node_types(keyword: str, include_docs: bool = True, limit: int = 5):
     """Search node types with optional live documentation integration."""
     try:
-        with db:
-            # Get static database results
-            node_types = db.search_node_types(keyword, limit)
-
-            basic_results = []
-            for nt in node_types:
-                basic_results.append({
-                    "name": nt.name,
-                    "category": nt.category,
-                    "description": nt.description,
-                    "inputs": f"{nt.min_inputs}-{nt.max_inputs}",
-                    "outputs": nt.max_outputs,
-                    "is_generator": nt.is_generator
-                })
+        # Get static database results
+        node_types = db.search_node_types(keyword, limit)
 
-            result = {
-                "keyword": keyword,
-                "node_types": basic_results,
-                "count": len(node_types)
-            }
+        basic_results = [_node_type_dict(nt) for nt in node_types]
 
-            if include_docs and node_types:
-                # Enhance top 3 results with live documentation
-                enhanced_nodes = []
-
-                for node in node_types[:3]:
-                    enhanced_node: dict[str, Any] = {
-                        "name": node.name,
-                        "category": node.category,
-                        "description": node.description,
-                        "inputs": f"{node.min_inputs}-{node.max_inputs}",
-                        "outputs": node.max_outputs,
-                        "is_generator": node.is_generator
-                    }
-
-                    # Use web search to find documentation
-                    search_query = f"Houdini {node.name} {node.category} node documentation examples"
-                    search_results = await vscode_websearchforcopilot_webSearch(search_query)
-                    enhanced_node["documentation_search"] = search_results.get("results", [])[:3]
-
-                    # Try to fetch SideFX official documentation
-                    if node.category.lower() in ['sop', 'top', 'object', 'dop']:
-                        doc_url = f"https://www.sidefx.com/docs/houdini/nodes/{node.category.lower()}/{node.name}.html"
-                        try:
-                            doc_content = await fetch_webpage([doc_url], f"{node.name} node documentation")
-                            official_docs: dict[str, Any] = {
-                                "url": doc_url,
-                                "content_preview": doc_content[:400] + "..." if len(doc_content) > 400 else doc_content
-                            }
-                            enhanced_node["official_docs"] = official_docs
-                        except:
-                            failed_docs: dict[str, Any] = {"url": doc_url, "status": "fetch_failed"}
-                            enhanced_node["official_docs"] = failed_docs
-
-                    enhanced_nodes.append(enhanced_node)
-
-                result["enhanced_results"] = enhanced_nodes
-                result["enhancement_note"] = "Top results enhanced with live documentation"
+        result = {
+            "keyword": keyword,
+            "node_types": basic_results,
+            "count": len(node_types)
+        }
 
-            return result
+        if include_docs and node_types:
+            # Enhance top 3 results with live documentation, concurrently
+            # Each starts as a copy of the basic result; the basic results are left as they are.
+            async def enhance(node: DBNodeTypeInfo, basic: dict[str, Any]) -> dict[str, Any]:
+                enhanced_node: dict[str, Any] = dict(basic)
+
+                # Use web search to find documentation
+                search_query = f"Houdini {node.name} {node.category} node documentation examples"
+                search_results = await vscode_websearchforcopilot_webSearch(search_query)
+                enhanced_node["documentation_search"] = search_results.get("results", [])[:3]
+
+                # Try to fetch SideFX official documentation
+                category = node.category.lower()
+                if category in _NODE_DOC_CATEGORIES:
+                    doc_url = _node_doc_url(category, node.name)
+                    try:
+                        doc_content = await fetch_webpage([doc_url], f"{node.name} node documentation")
+                        official_docs: dict[str, Any] = {
+                            "url": doc_url,
+                            "content_preview": doc_content[:400] + "..." if len(doc_content) > 400 else doc_content
+                        }
+                        enhanced_node["official_docs"] = official_docs
+                    except:
+                        failed_docs: dict[str, Any] = {"url": doc_url, "status": "fetch_failed"}
+                        enhanced_node["official_docs"] = failed_docs
+
+                return enhanced_node
+
+            result["enhanced_results"] = list(await asyncio.gather(
+                *(enhance(node, basic) for node, basic in zip(node_types[:3], basic_results))
+            ))
+            result["enhancement_note"] = "Top results enhanced with live documentation"
+
+        return result
 
     except Exception as e:
         return {"error": f"Enhanced search failed: {str(e)}"}
@@ -439,63 +599,51 @@ async def enhanced_search_node_types(keyword: str, include_docs: bool = True, li
 async def enhanced_search_functions(keyword: str, include_examples: bool = True, limit: int = 5):
     """Search functions with optional code examples and documentation."""
     try:
-        with db:
-            # Get static database results
-            functions = db.search_functions_by_keyword(keyword, limit)
-
-            basic_results = []
-            for f in functions:
-                basic_results.append({
-                    "name": f.name,
-                    "module": f.module,
-                    "datatype": f.datatype,
-                    "docstring": f.docstring[:200] + "..." if f.docstring and len(f.docstring) > 200 else f.docstring
-                })
+        # Get static database results
+        functions = db.search_functions_by_keyword(keyword, limit, doc_truncate=_DOC_PREVIEW)
 
-            result = {
-                "keyword": keyword,
-                "functions": basic_results,
-                "count": len(functions)
-            }
+        basic_results = [_function_dict(f) for f in functions]
 
-            if include_examples and functions:
-                # Enhance top 3 functions with examples
-                enhanced_functions = []
-
-                for func in functions[:3]:
-                    enhanced_func: dict[str, Any] = {
-                        "name": func.name,
-                        "module": func.module,
-                        "datatype": func.datatype,
-                        "docstring": func.docstring[:200] + "..." if func.docstring and len(func.docstring) > 200 else func.docstring
-                    }
-
-                    # Search for code examples and tutorials
-                    example_query = f"Houdini Python {func.name} code examples tutorial"
-                    search_results = await vscode_websearchforcopilot_webSearch(example_query)
-                    enhanced_func["example_search"] = search_results.get("results", [])[:3]
-
-                    # Try to fetch official HOM documentation
-                    if func.module == "hou":
-                        # Build HOM documentation URL
-                        doc_url = f"https://www.sidefx.com/docs/houdini/hom/hou/{func.name}.html"
-                        try:
-                            doc_content = await fetch_webpage([doc_url], f"{func.name} function documentation")
-                            hom_docs: dict[str, Any] = {
-                                "url": doc_url,
-                                "content_preview": doc_content[:400] + "..." if len(doc_content) > 400 else doc_content
-                            }
-                            enhanced_func["hom_docs"] = hom_docs
-                        except:
-                            failed_hom_docs: dict[str, Any] = {"url": doc_url, "status": "fetch_failed"}
-                            enhanced_func["hom_docs"] = failed_hom_docs
-
-                    enhanced_functions.append(enhanced_func)
-
-                result["enhanced_results"] = enhanced_functions
-                result["enhancement_note"] = "Top results enhanced with code examples and documentation"
+        result = {
+            "keyword": keyword,
+            "functions": basic_results,
+            "count": len(functions)
+        }
 
-            return result
+        if include_examples and functions:
+            # Enhance top 3 functions with examples, concurrently
+            # Each starts as a copy of the basic result; the basic results are left as they are.
+            async def enhance(func: DBFunctionInfo, basic: dict[str, Any]) -> dict[str, Any]:
+                enhanced_func: dict[str, Any] = dict(basic)
+
+                # Search for code examples and tutorials
+                example_query = f"Houdini Python {func.name} code examples tutorial"
+                search_results = await vscode_websearchforcopilot_webSearch(example_query)
+                enhanced_func["example_search"] = search_results.get("results", [])[:3]
+
+                # Try to fetch official HOM documentation
+                if func.module == "hou":
+                    # Build HOM documentation URL
+                    doc_url = _hom_doc_url(func.name)
+                    try:
+                        doc_content = await fetch_webpage([doc_url], f"{func.name} function documentation")
+                        hom_docs: dict[str, Any] = {
+                            "url": doc_url,
+                            "content_preview": doc_content[:400] + "..." if len(doc_content) > 400 else doc_content
+                        }
+                        enhanced_func["hom_docs"] = hom_docs
+                    except:
+                        failed_hom_docs: dict[str, Any] = {"url": doc_url, "status": "fetch_failed"}
+                        enhanced_func["hom_docs"] = failed_hom_docs
+
+                return enhanced_func
+
+            result["enhanced_results"] = list(await asyncio.gather(
+                *(enhance(func, basic) for func, basic in zip(functions[:3], basic_results))
+            ))
+            result["enhancement_note"] = "Top results enhanced with code examples and documentation"
+
+        return result
 
     except Exception as e:
         return {"error": f"Enhanced function search failed: {str(e)}"}
@@ -530,12 +678,14 @@ async def fetch_houdini_docs(doc_type: str, node_name: str = "", function_name:
         urls = []
 
         if doc_type == "node" and node_name:
-            # Try common node categories
-            for category in ['sop', 'top', 'object', 'dop', 'chop', 'cop2']:
-                urls.append(f"https://www.sidefx.com/docs/houdini/nodes/{category}/{node_name}.html")
+            # Try the categories the database knows the node in,
+            # or failing that, the common node categories.
+            categories = [c.lower() for c in db.get_node_type_categories(node_name)]
+            for category in categories or ['sop', 'top', 'object', 'dop', 'chop', 'cop2']:
+                urls.append(_node_doc_url(category, node_name))
 
         elif doc_type == "function" and function_name:
-            urls.append(f"https://www.sidefx.com/docs/houdini/hom/hou/{function_name}.html")
+            urls.append(_hom_doc_url(function_name))
 
         elif doc_type == "tutorial":
             # Search for tutorials
@@ -565,41 +715,37 @@ async def fetch_houdini_docs(doc_type: str, node_name: str = "", function_name:
 async def pdg_workflow_assistant(workflow_description: str):
     """Get PDG components and workflow guidance for a specific task."""
     try:
-        with db:
-            # Extract keywords and search PDG registry
-            keywords = workflow_description.lower().split()
-            relevant_entries = []
-
-            for keyword in keywords[:3]:  # Limit to avoid too many queries
-                entries = db.search_pdg_registry(keyword, limit=5)
-                relevant_entries.extend(entries)
-
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_entries = []
-            for entry in relevant_entries:
-                if entry.name not in seen:
-                    seen.add(entry.name)
-                    unique_entries.append(entry)
-
-            result = {
-                "workflow_description": workflow_description,
-                "pdg_components": [
-                    {
-                        "name": entry.name,
-                        "registry": entry.registry
-                    }
-                    for entry in unique_entries[:10]
-                ],
-                "count": len(unique_entries)
-            }
+        # Extract keywords and search PDG registry
+        keywords = workflow_description.lower().split()
+        # The first few keywords, in one query.
+        relevant_entries = db.search_pdg_registry_multi(keywords[:3], limit_per=5)
+
+        # Remove duplicates while preserving order
+        seen = set()
+        unique_entries = []
+        for entry in relevant_entries:
+            if entry.name not in seen:
+                seen.add(entry.name)
+                unique_entries.append(entry)
+
+        result = {
+            "workflow_description": workflow_description,
+            "pdg_components": [
+                {
+                    "name": entry.name,
+                    "registry": entry.registry
+                }
+                for entry in unique_entries[:10]
+            ],
+            "count": len(unique_entries)
+        }
 
-            # Enhance with web search for workflow guidance
-            workflow_query = f"Houdini PDG workflow {workflow_description} tutorial"
-            search_results = await vscode_websearchforcopilot_webSearch(workflow_query)
-            result["workflow_guidance"] = search_results.get("results", [])[:3]
+        # Enhance with web search for workflow guidance
+        workflow_query = f"Houdini PDG workflow {workflow_description} tutorial"
+        search_results = await vscode_websearchforcopilot_webSearch(workflow_query)
+        result["workflow_guidance"] = search_results.get("results", [])[:3]
 
-            return result
+        return result
 
     except Exception as e:
         return {"error": f"PDG workflow assistance failed: {str(e)}"}
@@ -608,27 +754,16 @@ async def pdg_workflow_assistant(workflow_description: str):
 async def get_node_types_by_category(category: str = ""):
     """Get node types, optionally filtered by category (e.g., 'Sop', 'Object', 'Dop')."""
     try:
-        with db:
-            if category:
-                node_types = db.get_node_types_by_category(category)
-            else:
-                node_types = db.get_node_types_by_category()[:50]  # Limit if no category
+        if category:
+            node_types = db.get_node_types_by_category(category)
+        else:
+            node_types = db.get_node_types_by_category()[:50]  # Limit if no category
 
-            return {
-                "category": category or "all",
-                "node_types": [
-                    {
-                        "name": nt.name,
-                        "category": nt.category,
-                        "description": nt.description,
-                        "inputs": f"{nt.min_inputs}-{nt.max_inputs}",
-                        "outputs": nt.max_outputs,
-                        "is_generator": nt.is_generator
-                    }
-                    for nt in node_types
-                ],
-                "count": len(node_types)
-            }
+        return {
+            "category": category or "all",
+            "node_types": [_node_type_dict(nt) for nt in node_types],
+            "count": len(node_types)
+        }
     except Exception as e:
         return {"error": f"Database query failed: {str(e)}"}
 
@@ -636,12 +771,11 @@ async def get_node_types_by_category(category: str = ""):
 async def get_database_stats():
     """Get statistics about the Houdini database contents."""
     try:
-        with db:
-            stats = db.get_database_stats()
-            return {
-                "database_path": str(db.db_path),
-                "statistics": stats
-            }
+        stats = db.get_database_stats()
+        return {
+            "database_path": str(db.db_path),
+            "statistics": stats
+        }
     except Exception as e:
         return {"error": f"Database query failed: {str(e)}"}
 
@@ -649,19 +783,18 @@ async def get_database_stats():
 async def get_pdg_registry(registry_type: str | None = None):
     """Get PDG (TOPs) registry entries, optionally filtered by registry type (Node, Scheduler, Service, etc.)."""
     try:
-        with db:
-            entries = db.get_pdg_registry(registry_type)
-            return {
-                "entries": [
-                    {
-                        "name": entry.name,
-                        "registry": entry.registry
-                    }
-                    for entry in entries
-                ],
-                "count": len(entries),
-                "registry_type": registry_type or "all"
-            }
+        entries = db.get_pdg_registry(registry_type)
+        return {
+            "entries": [
+                {
+                    "name": entry.name,
+                    "registry": entry.registry
+                }
+                for entry in entries
+            ],
+            "count": len(entries),
+            "registry_type": registry_type or "all"
+        }
     except Exception as e:
         return {"error": f"Database query failed: {str(e)}"}
 
@@ -669,29 +802,94 @@ async def get_pdg_registry(registry_type: str | None = None):
 async def search_pdg_registry(keyword: str, limit: int = 50):
     """Search PDG registry entries by keyword in name."""
     try:
-        with db:
-            entries = db.search_pdg_registry(keyword, limit)
-            return {
-                "entries": [
-                    {
-                        "name": entry.name,
-                        "registry": entry.registry
-                    }
-                    for entry in entries
-                ],
-                "count": len(entries),
-                "keyword": keyword
-            }
+        entries = db.search_pdg_registry(keyword, limit)
+        return {
+            "entries": [
+                {
+                    "name": entry.name,
+                    "registry": entry.registry
+                }
+                for entry in entries
+            ],
+            "count": len(entries),
+            "keyword": keyword
+        }
     except Exception as e:
         return {"error": f"Database query failed: {str(e)}"}
 
 @mcp.tool("query_response")
 async def query_response(query: str):
     """Handle a general query and return a canned response (legacy tool)."""
-    return {"response": f'{RESPONSES_DIR}.json'}
     if not query:
         return {"error": "No query provided."}
-    return {"response": await RESPONSES.get(query, awaitable_value("No response found."))}
+    return {"response": _lookup_response(RESPONSES, query)}
+
+class BatchCall(TypedDict):
+    """One tool call within a batch_execute request."""
+    tool: str
+    args: NotRequired[dict[str, Any]]
+
+class _BatchStopped(Exception):
+    """Raised within batch_execute to stop the batch after a failed call."""
+
+BATCH_TOOLS: dict[str, Callable[..., Awaitable[Any]]] = {
+    "get_functions_returning_nodes": get_functions_returning_nodes,
+    "search_functions": search_functions,
+    "get_primitive_functions": get_primitive_functions,
+    "get_modules_summary": get_modules_summary,
+    "search_node_types": search_node_types,
+    "enhanced_search_node_types": enhanced_search_node_types,
+    "enhanced_search_functions": enhanced_search_functions,
+    "web_search_houdini": web_search_houdini,
+    "fetch_houdini_docs": fetch_houdini_docs,
+    "pdg_workflow_assistant": pdg_workflow_assistant,
+    "get_node_types_by_category": get_node_types_by_category,
+    "get_database_stats": get_database_stats,
+    "get_pdg_registry": get_pdg_registry,
+    "search_pdg_registry": search_pdg_registry,
+    "query_response": query_response,
+}
+'''
+The tools that can be called via `batch_execute`, by name.
+'''
+
+@mcp.tool("batch_execute")
+async def batch_execute(calls: list[BatchCall], max_concurrent: int = 8, stop_on_error: bool = False):
+    """
+    Run several tool calls in one request, concurrently.
+
+    Each call is `{"tool": name, "args": {...}}`. Results are returned in the
+    same order as the calls. If `stop_on_error` is set, the first call to fail
+    cancels the rest.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+    results: list[Any] = [{"error": "Cancelled after an earlier call failed."} for _ in calls]
+
+    async def run_call(index: int, call: BatchCall):
+        tool_name = call.get("tool", "")
+        tool = BATCH_TOOLS.get(tool_name)
+        if tool is None:
+            result: Any = {"error": f"Unknown tool: {tool_name}"}
+        else:
+            async with semaphore:
+                try:
+                    result = await tool(**call.get("args", {}))
+                except Exception as e:
+                    result = {"error": f"{tool_name} failed: {str(e)}"}
+        results[index] = result
+        if stop_on_error and isinstance(result, dict) and "error" in result:
+            raise _BatchStopped()
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            for index, call in enumerate(calls):
+                group.create_task(run_call(index, call))
+    except* _BatchStopped:
+        pass
+    return {
+        "results": results,
+        "count": len(results)
+    }
 
 @mcp.resource("status://status")
 async def status() -> dict[str, Any]:
@@ -713,7 +911,27 @@ async def prompt(prompt: str, data: dict[str, Any]) -> dict[str, Any]:
     """Handle a prompt and return a canned response."""
     if not prompt:
         return {"error": "No prompt provided."}
-    return {"response": await PROMPTS.get(prompt, awaitable_value("No response found."))}
+    return {"response": _lookup_response(PROMPTS, prompt)}
+
+_TOOLS_HELP = (
+    ("get_functions_returning_nodes", "Find functions that return Houdini node objects"),
+    ("search_functions", "Search functions by keyword (requires: keyword, optional: limit)"),
+    ("enhanced_search_functions", "Search functions with code examples and docs (requires: keyword, optional: include_examples, limit)"),
+    ("get_primitive_functions", "Find functions related to primitive operations"),
+    ("get_modules_summary", "Get summary of all Houdini modules with function counts"),
+    ("search_node_types", "Search node types by keyword (requires: keyword, optional: limit)"),
+    ("enhanced_search_node_types", "Search node types with live documentation (requires: keyword, optional: include_docs, limit)"),
+    ("get_node_types_by_category", "Get node types by category (optional: category)"),
+    ("get_database_stats", "Get statistics about the Houdini database contents"),
+    ("get_pdg_registry", "Get PDG registry entries (optional: registry_type)"),
+    ("search_pdg_registry", "Search PDG registry entries by keyword (requires: keyword, optional: limit)"),
+    ("pdg_workflow_assistant", "Get PDG components and workflow guidance (requires: workflow_description)"),
+    ("web_search_houdini", "Perform web search for Houdini content (requires: query, optional: num_results)"),
+    ("fetch_houdini_docs", "Fetch official Houdini documentation (requires: doc_type, optional: node_name, function_name)"),
+    ("query_response", "Handle general queries (requires: query)"),
+    ("batch_execute", "Run several tools concurrently (requires: calls, optional: max_concurrent, stop_on_error)"),
+)
+'The tools and their descriptions, as listed by --help-tools.'
 
 @click.command()
 @click.option('--help-tools', is_flag=True, help='Show detailed information about available MCP tools and exit')
@@ -735,6 +953,7 @@ def main(help_tools: bool = False):
     • web_search_houdini              - Perform web search specifically for Houdini-related content
     • fetch_houdini_docs              - Fetch official Houdini documentation for nodes or functions
     • query_response                  - Handle general queries (legacy tool)
+    • batch_execute                   - Run several of the above tools concurrently in one request
 
     Database: {db.db_path if hasattr(db, 'db_path') else 'Not initialized'}
 
@@ -754,25 +973,7 @@ def main(help_tools: bool = False):
         click.echo(*args, **kwargs, err=err)
     if help_tools:
         echo("🔧 Zabob MCP Server - Available Tools:\n")
-        tools = [
-            ("get_functions_returning_nodes", "Find functions that return Houdini node objects"),
-            ("search_functions", "Search functions by keyword (requires: keyword, optional: limit)"),
-            ("enhanced_search_functions", "Search functions with code examples and docs (requires: keyword, optional: include_examples, limit)"),
-            ("get_primitive_functions", "Find functions related to primitive operations"),
-            ("get_modules_summary", "Get summary of all Houdini modules with function counts"),
-            ("search_node_types", "Search node types by keyword (requires: keyword, optional: limit)"),
-            ("enhanced_search_node_types", "Search node types with live documentation (requires: keyword, optional: include_docs, limit)"),
-            ("get_node_types_by_category", "Get node types by category (optional: category)"),
-            ("get_database_stats", "Get statistics about the Houdini database contents"),
-            ("get_pdg_registry", "Get PDG registry entries (optional: registry_type)"),
-            ("search_pdg_registry", "Search PDG registry entries by keyword (requires: keyword, optional: limit)"),
-            ("pdg_workflow_assistant", "Get PDG components and workflow guidance (requires: workflow_description)"),
-            ("web_search_houdini", "Perform web search for Houdini content (requires: query, optional: num_results)"),
-            ("fetch_houdini_docs", "Fetch official Houdini documentation (requires: doc_type, optional: node_name, function_name)"),
-            ("query_response", "Handle general queries (requires: query)")
-        ]
-
-        for tool_name, description in tools:
+        for tool_name, description in _TOOLS_HELP:
             echo(f"  {tool_name:30} - {description}")
 
         echo(f"\n📊 Database: {db.db_path if hasattr(db, 'db_path') else 'Not initialized'}")
@@ -782,6 +983,10 @@ def main(help_tools: bool = False):
     echo("🚀 Starting Zabob MCP Server...")
     echo(f"📊 Database: {db.db_path if hasattr(db, 'db_path') else 'Not initialized'}")
     echo("🔗 Waiting for MCP client connections...")
+    # Use uvloop's faster event loop where it's installed. (It isn't available on Windows.)
+    with suppress(ImportError):
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     mcp.run()
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@
 Test script for the Zabob database functionality.
 """
 
+from itertools import islice
 import sys
 from pathlib import Path
 
@@ -17,12 +18,12 @@ for p in (CORE_SRC, COMMON_SRC, MCP_SRC):
         sys.path.insert(0, str(p))
 
 try:
-    from zabob.mcp.database import HoudiniDatabase
+    from zabob.mcp.database import get_db
 
     print("Testing Zabob database functionality...")
 
     # Initialize database
-    db = HoudiniDatabase()
+    db = get_db()
     print(f"Database path: {db.db_path}")
 
     # Test database stats
@@ -40,16 +41,14 @@ try:
 
         # Test functions returning nodes
         print("\nFunctions returning nodes...")
-        returning_nodes = db.get_functions_returning_nodes()
-        print(f"Found {len(returning_nodes)} functions that return nodes")
-        for func in returning_nodes[:5]:  # Show first 5
+        print(f"Found {db.count_functions_returning_nodes()} functions that return nodes")
+        for func in islice(db.iter_functions_returning_nodes(), 5):  # Show first 5
             print(f"  {func.module}.{func.name} -> {func.datatype}")
 
         # Test primitive functions
         print("\nPrimitive-related functions...")
-        prim_functions = db.get_primitive_related_functions()
-        print(f"Found {len(prim_functions)} primitive-related functions")
-        for func in prim_functions[:5]:  # Show first 5
+        print(f"Found {db.count_primitive_related_functions()} primitive-related functions")
+        for func in islice(db.iter_primitive_related_functions(), 5):  # Show first 5
             print(f"  {func.module}.{func.name}")
 
     print("\n✅ Database test completed successfully!")
@@ -8,34 +8,35 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 try:
-    from zabob.mcp.database import HoudiniDatabase
+    from zabob.mcp.database import get_db
 
     print("🧪 Testing PDG Registry functionality...")
 
     # Test database connection
-    db = HoudiniDatabase()
+    db = get_db()
     print(f"✅ Database found: {db.db_path}")
 
     with db:
         # Test get all PDG registry entries
-        all_entries = db.get_pdg_registry()
-        print(f"\n📊 Total PDG registry entries: {len(all_entries)}")
+        # Only the sample entries are read; the database counts the rest.
+        sample_entries, total = db.get_pdg_registry_with_count(limit=5)
+        print(f"\n📊 Total PDG registry entries: {total}")
 
         # Show sample entries
-        if all_entries:
+        if sample_entries:
             print("   Sample entries:")
-            for entry in all_entries[:5]:
+            for entry in sample_entries:
                 print(f"     • {entry.name} ({entry.registry})")
 
         # Test filtering by registry type
-        node_entries = db.get_pdg_registry("Node")
-        print(f"\n🔧 Node registry entries: {len(node_entries)}")
+        node_count = db.count_pdg_registry("Node")
+        print(f"\n🔧 Node registry entries: {node_count}")
 
-        scheduler_entries = db.get_pdg_registry("Scheduler")
-        print(f"📅 Scheduler registry entries: {len(scheduler_entries)}")
+        scheduler_count = db.count_pdg_registry("Scheduler")
+        print(f"📅 Scheduler registry entries: {scheduler_count}")
 
-        service_entries = db.get_pdg_registry("Service")
-        print(f"🔧 Service registry entries: {len(service_entries)}")
+        service_count = db.count_pdg_registry("Service")
+        print(f"🔧 Service registry entries: {service_count}")
 
         # Test search functionality
         search_results = db.search_pdg_registry("file", limit=5)
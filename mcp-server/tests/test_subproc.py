@@ -0,0 +1,66 @@
+'''
+Unit tests for the pooled path of subproc.run
+'''
+
+import os
+import threading
+import time
+
+import pytest
+
+from zabob.common import subproc
+from zabob.common.subproc import SpawnerPool
+
+
+pytestmark = pytest.mark.skipif(os.name != 'posix', reason="The spawner pool is POSIX-only")
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = SpawnerPool(size=1)
+    monkeypatch.setattr(subproc, 'spawner_pool', lambda: pool)
+    yield pool
+    pool.close()
+
+
+class TestPooledRun:
+    """Test subproc.run when routed through a SpawnerPool."""
+
+    def test_success(self, pool):
+        result = subproc.run('true')
+        assert result.returncode == 0
+
+    def test_exit_code(self, pool):
+        with pytest.raises(RuntimeError, match="return code 3"):
+            subproc.run('sh', '-c', 'exit 3')
+        # The helper is still usable after a failing command.
+        assert subproc.run('true').returncode == 0
+
+    def test_cwd_and_env(self, pool, tmp_path):
+        env = {**os.environ, 'ZABOB_TEST_VAR': 'bar'}
+        script = f'test "$(pwd -P)" = "{tmp_path.resolve()}" && test "$ZABOB_TEST_VAR" = bar'
+        assert subproc.run('sh', '-c', script, cwd=tmp_path, env=env).returncode == 0
+        with pytest.raises(RuntimeError):
+            subproc.run('sh', '-c', 'test "$ZABOB_TEST_VAR" = bar', env={**os.environ})
+
+    def test_falls_back_without_helpers(self, pool):
+        pool.close()
+        assert pool.run(['/bin/true'], dict(os.environ)) is None
+        assert subproc.run('true').returncode == 0
+
+    def test_close_does_not_wait_for_commands(self, pool):
+        errors = []
+        def run_slowly():
+            try:
+                pool.run(['/bin/sleep', '5'], dict(os.environ))
+            except BaseException as e:
+                errors.append(e)
+        thread = threading.Thread(target=run_slowly)
+        thread.start()
+        time.sleep(0.2)
+        start = time.monotonic()
+        for spawner in list(pool._all):
+            spawner.close(timeout=0.1)
+        thread.join()
+        assert time.monotonic() - start < 2
+        assert errors
@@ -4,6 +4,7 @@ Example queries demonstrating how Zabob can help Houdini users understand comple
 This simulates the kinds of questions users would ask when encountering large node graphs.
 """
 
+from itertools import islice
 import json
 import sys
 from pathlib import Path
@@ -52,7 +53,8 @@ def simulate_user_questions():
         print("\n👤 User: 'I need to select and modify groups of primitives in Python. What functions should I use?'")
         print("🤖 Zabob: Here are the primitive-related functions available...")
 
-        prim_functions = db.get_primitive_related_functions()
+        # Read only the functions we show, and count the rest in the database.
+        prim_functions = islice(db.iter_primitive_related_functions(), 15)
         prim_response = {
             "functions": [
                 {
@@ -60,9 +62,9 @@ def simulate_user_questions():
                     "module": f.module,
                     "purpose": "primitive operations"
                 }
-                for f in prim_functions[:15]  # Show first 15
+                for f in prim_functions  # Show first 15
             ],
-            "total_found": len(prim_functions),
+            "total_found": db.count_primitive_related_functions(),
             "recommendation": "Focus on hou.Geometry and hou.Prim modules for primitive operations"
         }
         format_response(prim_response, "Primitive Operation Functions")
@@ -71,7 +73,7 @@ def simulate_user_questions():
         print("\n👤 User: 'How do I create nodes dynamically in my Python script?'")
         print("🤖 Zabob: Here are functions that return node objects...")
 
-        node_functions = db.get_functions_returning_nodes()
+        node_functions = islice(db.iter_functions_returning_nodes(), 10)
         node_response = {
             "functions": [
                 {
@@ -79,9 +81,9 @@ def simulate_user_questions():
                     "module": f.module,
                     "returns": f.datatype
                 }
-                for f in node_functions[:10]  # Show first 10
+                for f in node_functions  # Show first 10
             ],
-            "total_found": len(node_functions),
+            "total_found": db.count_functions_returning_nodes(),
             "tip": "Look for createNode() methods in parent container objects"
         }
         format_response(node_response, "Node Creation Functions")